@@ -6,76 +6,58 @@ import numpy as np
 from pandas import DataFrame
 
 
-def _touch(high, low, level, open, close):
+def _levels(level) -> np.ndarray:
     """
-    was the given level touched
-    :param high:
-    :param low:
-    :param level:
-    :return:
+    levels as a column vector, to broadcast against the candles
     """
-    if high > level and low < level:
-        if open >= close:
-            return -1
-        else:
-            return 1
-    else:
-        return 0
-
-
-def _bounce(open, close, level, previous_touch):
-    """
-    did we bounce above the given level
-    :param open:
-    :param close:
-    :param level:
-    :param previous_touch
-    :return:
-    """
-
-    if previous_touch == 1 and open > level and close > level:
-        return 1
-    elif previous_touch == 1 and open < level and close < level:
-        return -1
-    else:
-        return 0
+    return np.atleast_1d(np.asarray(level, dtype=np.float64))[:, None]
 
 
 def bounce(dataframe: DataFrame, level):
     """
 
     :param dataframe:
-    :param level:
-    :return:
+    :param level: level, or an array of levels
+    :return: int8 array, of shape (levels, candles) if an array of levels is passed
       1 if it bounces up
       0 if no bounce
      -1 if it bounces below
     """
 
-    from scipy.ndimage.interpolation import shift
+    open = dataframe["open"].to_numpy()
+    close = dataframe["close"].to_numpy()
+    levels = _levels(level)
+
+    touch = np.atleast_2d(touches(dataframe, level))
+    previous_touch = np.zeros(touch.shape, dtype=bool)
+    previous_touch[:, 1:] = touch[:, :-1] == 1
 
-    open = dataframe["open"]
-    close = dataframe["close"]
-    touch = shift(touches(dataframe, level), 1, cval=np.nan)
+    up = previous_touch & (open > levels) & (close > levels)
+    down = previous_touch & (open < levels) & (close < levels)
+    result = up.astype(np.int8) - down.astype(np.int8)
 
-    return np.vectorize(_bounce)(open, close, level, touch)
+    return result[0] if np.ndim(level) == 0 else result
 
 
 def touches(dataframe: DataFrame, level):
     """
     :param dataframe: our incoming dataframe
-    :param level: where do we want to calculate the touches
-    returns all the touches of the dataframe on the given level
+    :param level: where do we want to calculate the touches - a level, or an array of levels
+    returns all the touches of the dataframe on the given level(s)
 
-    :returns
+    :returns int8 array, of shape (levels, candles) if an array of levels is passed
      1 if it touches and closes above
      0 if it doesn't touch
     -1 if it touches and closes below
     """
 
-    open = dataframe["open"]
-    close = dataframe["close"]
-    high = dataframe["high"]
-    low = dataframe["low"]
+    open = dataframe["open"].to_numpy()
+    close = dataframe["close"].to_numpy()
+    high = dataframe["high"].to_numpy()
+    low = dataframe["low"].to_numpy()
+    levels = _levels(level)
+
+    direction = np.where(open >= close, -1, 1).astype(np.int8)
+    result = ((high > levels) & (low < levels)) * direction
 
-    return np.vectorize(_touch)(high, low, level, open, close)
+    return result[0] if np.ndim(level) == 0 else result
@@ -1,194 +1,81 @@
 import numpy as np
 import pandas as pd
-from scipy.ndimage import shift
 
+from technical.kernels import iir_filter
 
-def heikinashi(bars):
+
+def heikinashi(bars, flags=True):
     """
     Heikin Ashi calculation: https://school.stockcharts.com/doku.php?id=chart_analysis:heikin_ashi
 
-    ha_open calculation based on: https://stackoverflow.com/a/55110393
-    ha_open = [ calculate first record ][ append remaining records with list comprehension method ]
-    list comprehension method is significantly faster as a for loop
-
     result:
     ha_open[0] =  (bars.open[0] + bars.close[0]) / 2
     ha_open[1] = (ha_open[0] + ha_close[0]) / 2
     ...
     ha_open[last] = ha_open[len(bars)-1] + ha_close[len(bars)-1]) / 2
-    """
 
-    bars = bars.copy()
+    ha_open is a first order recursion, so it's computed with a linear IIR filter.
+
+    :param bars: dataframe containing open, high, low and close columns
+    :param flags: also compute the candle helper columns (flat_bottom, flat_top, small_body,
+        candle, reversal, lower_wick and upper_wick). Flags are int8.
+    :return: dataframe with heikin ashi open, high, low and close (and helper columns)
+    """
+    open = bars["open"].to_numpy(dtype=np.float64)
+    high = bars["high"].to_numpy(dtype=np.float64)
+    low = bars["low"].to_numpy(dtype=np.float64)
+    close = bars["close"].to_numpy(dtype=np.float64)
 
-    bars.loc[:, "ha_close"] = bars.loc[:, ["open", "high", "low", "close"]].mean(axis=1)
+    ha_close = (open + high + low + close) / 4
 
-    ha_open = [(bars.open[0] + bars.close[0]) / 2]
-    [ha_open.append((ha_open[x] + bars.ha_close[x]) / 2) for x in range(len(bars) - 1)]
-    bars["ha_open"] = ha_open
+    # ha_open[i] = 0.5 * ha_close[i - 1] + 0.5 * ha_open[i - 1], seeded with the first candle
+    seed = np.empty(len(bars))
+    seed[:1] = (open[:1] + close[:1]) / 2
+    seed[1:] = ha_close[:-1]
+    ha_open = iir_filter([0.5], [1, -0.5], seed, warmup=1)
 
-    bars.loc[:, "ha_high"] = bars.loc[:, ["high", "ha_open", "ha_close"]].max(axis=1)
-    bars.loc[:, "ha_low"] = bars.loc[:, ["low", "ha_open", "ha_close"]].min(axis=1)
+    ha_high = np.fmax(np.fmax(high, ha_open), ha_close)
+    ha_low = np.fmin(np.fmin(low, ha_open), ha_close)
 
     result = pd.DataFrame(
         index=bars.index,
         data={
-            "open": bars["ha_open"],
-            "high": bars["ha_high"],
-            "low": bars["ha_low"],
-            "close": bars["ha_close"],
+            "open": ha_open,
+            "high": ha_high,
+            "low": ha_low,
+            "close": ha_close,
         },
     )
+    if not flags:
+        return result
 
-    # useful little helpers
-    result["flat_bottom"] = np.vectorize(_flat_bottom)(
-        result["close"], result["low"], result["open"], result["high"]
-    )
-    result["flat_top"] = np.vectorize(_flat_top)(
-        result["close"], result["low"], result["open"], result["high"]
-    )
-    result["small_body"] = np.vectorize(_small_body)(
-        result["close"], result["low"], result["open"], result["high"]
-    )
-    result["candle"] = np.vectorize(_candle_type)(result["open"], result["close"])
-    result["reversal"] = np.vectorize(_reversal)(
-        result["candle"], shift(result["candle"], 1, cval=np.nan)
-    )
+    green = ha_open < ha_close
+    top_wick = np.where(green, ha_high - ha_close, ha_high - ha_open)
+    bottom_wick = np.where(green, ha_open - ha_low, ha_close - ha_low)
 
-    result["lower_wick"] = np.vectorize(_wick_length)(
-        result["close"], result["low"], result["open"], result["high"], False
-    )
-    result["upper_wick"] = np.vectorize(_wick_length)(
-        result["close"], result["low"], result["open"], result["high"], True
-    )
+    # useful little helpers
+    # flat bottom: 1 flat and green, -1 flat and red, 0 not flat
+    flat_bottom = np.select([ha_open == ha_low, ha_close == ha_low], [1, -1], 0)
+    # flat top: 1 flat and green, -1 flat and red, 0 no flat top
+    flat_top = np.select([ha_high == ha_close, ha_high == ha_open], [1, -1], 0)
+    # small body: 1 if wicks are longer than the body, 0 otherwise
+    small_body = top_wick + bottom_wick > np.abs(ha_close - ha_open)
+    # candle: 1 on green, -1 on red
+    candle = np.where(green, 1, -1)
+    # reversal: 1 if red to green, -1 if green to red, 0 if none
+    reversal = np.zeros(len(bars))
+    reversal[1:] = np.where(candle[1:] != candle[:-1], candle[1:], 0)
+
+    result["flat_bottom"] = flat_bottom.astype(np.int8)
+    result["flat_top"] = flat_top.astype(np.int8)
+    result["small_body"] = small_body.astype(np.int8)
+    result["candle"] = candle.astype(np.int8)
+    result["reversal"] = reversal.astype(np.int8)
+    result["lower_wick"] = bottom_wick
+    result["upper_wick"] = top_wick
     return result
 
 
-def _reversal(current, prior):
-    """
-    do we observe a reversal
-    :param current:
-    :param prior:
-    :return:
-         1 if red to green
-         0 if none
-        -1 if green to red
-    """
-    if current == 1 and prior == -1:
-        return 1
-    elif current == -1 and prior == 1:
-        return -1
-    else:
-        return 0
-
-
-def _candle_type(open, close):
-    """
-
-    :param open:
-    :param close:
-    :return: 1 on green, -1 on red
-    """
-    if open < close:
-        return 1
-    else:
-        return -1
-
-
-def _wick_length(close, low, open, high, upper):
-    """
-    :param close:
-    :param low:
-    :param open:
-    :param high:
-    :return:
-
-    """
-
-    if close > open:
-        top_wick = high - close
-        bottom_wick = open - low
-
-    else:
-        top_wick = high - open
-        bottom_wick = close - low
-
-    if upper:
-        return top_wick
-    else:
-        return bottom_wick
-
-
-def _small_body(close, low, open, high):
-    """
-    do we have a small body in relation to the wicks
-    :param close:
-    :param low:
-    :param open:
-    :param high:
-    :return:
-      0 if no
-      1 if yes (wicks are longer than body)
-
-    """
-    size = abs(close - open)
-
-    if close > open:
-        top_wick = high - close
-        bottom_wick = open - low
-
-    else:
-        top_wick = high - open
-        bottom_wick = close - low
-
-    wick_size = top_wick + bottom_wick
-
-    if wick_size > size:
-        return 1
-    else:
-        return 0
-
-
-def _flat_top(close, low, open, high):
-    """
-    do we have a flat top
-
-    :param close:
-    :param low:
-    :param open:
-    :param high:
-    :return: 1 if flat and green candle
-             0 if no flat top
-            -1 of flat top and red candle
-
-    """
-    if high == close:
-        return 1
-    elif high == open:
-        return -1
-    else:
-        return 0
-
-
-def _flat_bottom(close, low, open, high):
-    """
-    do we have a flat bottom
-    :param close:
-    :param low:
-    :param open:
-    :param high:
-    :return:
-        1 flat and green
-       -1 flat and red
-        0 not flat
-    """
-    if open == low:
-        return 1
-    elif close == low:
-        return -1
-    else:
-        return 0
-
-
 def _body_size(open, close):
     return abs(open - close)
 
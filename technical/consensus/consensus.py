@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import talib.abstract as ta
 
@@ -285,37 +286,42 @@ class Consensus:
 
     def evaluate_ema(self, period, field="close", prefix="ema", impact_buy=1, impact_sell=1):
         """
-        evaluates a sma moving average
+        evaluates a ema moving average
         :param dataframe:
-        :param period:
+        :param period: period, or a list of periods - evaluated as one indicator each
         :param prefix:
         :return:
         """
-        self._weights(impact_buy, impact_sell)
-        dataframe = self.dataframe
-        name = f"{prefix}_{field}_{period}"
-        dataframe[name] = ta.EMA(dataframe, timeperiod=period, field=field)
-
-        dataframe.loc[(dataframe[name] < dataframe[field]), f"buy_{name}"] = 1 * impact_buy
-
-        dataframe.loc[(dataframe[name] > dataframe[field]), f"sell_{name}"] = 1 * impact_sell
+        self._evaluate_ma("ema", period, field, prefix, impact_buy, impact_sell)
 
     def evaluate_sma(self, period, field="close", prefix="sma", impact_buy=1, impact_sell=1):
         """
         evaluates a sma moving average
         :param dataframe:
-        :param period:
+        :param period: period, or a list of periods - evaluated as one indicator each
         :param prefix:
         :return:
         """
-        self._weights(impact_buy, impact_sell)
-        name = f"{prefix}_{field}_{period}"
+        self._evaluate_ma("sma", period, field, prefix, impact_buy, impact_sell)
+
+    def _evaluate_ma(self, kind, period, field, prefix, impact_buy, impact_sell):
+        """
+        helper method computing all periods of a moving average in one go
+        """
+        from technical.indicators import ma_bank
+
         dataframe = self.dataframe
-        dataframe[name] = ta.SMA(dataframe, timeperiod=period, field=field)
+        periods = np.atleast_1d(period)
+        mas = ma_bank(dataframe, periods, kind=kind, field=field)
 
-        dataframe.loc[(dataframe[name] < dataframe[field]), f"buy_{name}"] = 1 * impact_buy
+        for timeperiod, ma in zip(periods, mas):
+            self._weights(impact_buy, impact_sell)
+            name = f"{prefix}_{field}_{timeperiod}"
+            dataframe[name] = ma
 
-        dataframe.loc[(dataframe[name] > dataframe[field]), f"sell_{name}"] = 1 * impact_sell
+            dataframe.loc[(dataframe[name] < dataframe[field]), f"buy_{name}"] = 1 * impact_buy
+
+            dataframe.loc[(dataframe[name] > dataframe[field]), f"sell_{name}"] = 1 * impact_sell
 
     def evaluate_laguerre(self, prefix="lag", impact_buy=1, impact_sell=1):
         """
@@ -12,19 +12,9 @@ class MovingAverageConsensus(Consensus):
     def __init__(self, dataframe):
         super().__init__(dataframe)
 
-        self.evaluate_sma(period=10)
-        self.evaluate_sma(period=20)
-        self.evaluate_sma(period=30)
-        self.evaluate_sma(period=50)
-        self.evaluate_sma(period=100)
-        self.evaluate_sma(period=200)
+        self.evaluate_sma(period=[10, 20, 30, 50, 100, 200])
 
-        self.evaluate_ema(period=10)
-        self.evaluate_ema(period=20)
-        self.evaluate_ema(period=30)
-        self.evaluate_ema(period=50)
-        self.evaluate_ema(period=100)
-        self.evaluate_ema(period=200)
+        self.evaluate_ema(period=[10, 20, 30, 50, 100, 200])
         self.evaluate_ichimoku()
         self.evaluate_hull()
         self.evaluate_vwma(period=20)
@@ -2,7 +2,9 @@ from math import cos, exp, pi, sqrt
 
 import numpy as np
 import talib as ta
-from pandas import Series
+from pandas import DataFrame, Series
+
+from technical.kernels import iir_filter
 
 
 def went_up(series: Series) -> bool:
@@ -14,22 +16,26 @@ def went_down(series: Series) -> bool:
 
 
 def ehlers_super_smoother(series: Series, smoothing: float = 6) -> Series:
+    """
+    Ehlers super smoother - a 2 pole IIR filter.
+    A DataFrame filters all of its columns in one call.
+    The first 2 values are passed through unfiltered and seed the filter.
+    """
     magic = pi * sqrt(2) / smoothing
     a1 = exp(-magic)
     coeff2 = 2 * a1 * cos(magic)
     coeff3 = -a1 * a1
     coeff1 = (1 - coeff2 - coeff3) / 2
 
-    filtered = series.copy()
-
-    for i in range(2, len(series)):
-        filtered.iloc[i] = (
-            coeff1 * (series.iloc[i] + series.iloc[i - 1])
-            + coeff2 * filtered.iloc[i - 1]
-            + coeff3 * filtered.iloc[i - 2]
-        )
+    # filtered[i] = coeff1 * (series[i] + series[i - 1])
+    #     + coeff2 * filtered[i - 1] + coeff3 * filtered[i - 2]
+    filtered = iir_filter(
+        [coeff1, coeff1], [1, -coeff2, -coeff3], series.to_numpy(dtype=np.float64).T, warmup=2
+    )
 
-    return filtered
+    if isinstance(series, DataFrame):
+        return DataFrame(filtered.T, index=series.index, columns=series.columns)
+    return Series(filtered, index=series.index, name=series.name)
 
 
 def fishers_inverse(series: Series, smoothing: float = 0) -> np.ndarray:
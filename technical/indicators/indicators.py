@@ -52,22 +52,21 @@ def ichimoku(
         leading_senkou_span_b, chikou_span, cloud_green, cloud_red
     """
 
-    tenkan_sen = (
-        dataframe["high"].rolling(window=conversion_line_period).max()
-        + dataframe["low"].rolling(window=conversion_line_period).min()
-    ) / 2
+    from technical.kernels import rolling_max, rolling_min
 
-    kijun_sen = (
-        dataframe["high"].rolling(window=base_line_periods).max()
-        + dataframe["low"].rolling(window=base_line_periods).min()
+    # Donchian midlines for all three periods at once
+    periods = [conversion_line_period, base_line_periods, laggin_span]
+    midlines = (
+        rolling_max(dataframe["high"], periods) + rolling_min(dataframe["low"], periods)
     ) / 2
 
+    tenkan_sen = Series(midlines[0], index=dataframe.index)
+
+    kijun_sen = Series(midlines[1], index=dataframe.index)
+
     leading_senkou_span_a = (tenkan_sen + kijun_sen) / 2
 
-    leading_senkou_span_b = (
-        dataframe["high"].rolling(window=laggin_span).max()
-        + dataframe["low"].rolling(window=laggin_span).min()
-    ) / 2
+    leading_senkou_span_b = Series(midlines[2], index=dataframe.index)
 
     senkou_span_a = leading_senkou_span_a.shift(displacement - 1)
 
@@ -101,94 +100,74 @@ def laguerre(dataframe, gamma=0.75, smooth=1, debug=False) -> Series:
     Author Creslin
     Original Author: John Ehlers 1979
 
-    :param dataframe: df
-    :param gamma: Between 0 and 1, default 0.75
-    :param smooth: 1 is off. Valid values over 1 are alook back smooth for an ema
-    :param debug: Bool, prints to console
-    :return: Laguerre RSI:values 0 to +1
-    """
-    """
-    Laguerra RSI
     How to trade lrsi:  (TL, DR) buy on the flat 0, sell on the drop from top,
     not when touch the top
     http://systemtradersuccess.com/testing-laguerre-rsi/
 
     http://www.davenewberg.com/Trading/TS_Code/Ehlers_Indicators/Laguerre_RSI.html
-    """
 
-    df = dataframe
-    g = gamma
-    if debug:
-        from pandas import set_option
+    Original Pine Logic  Block1
+    p = close
+    L0 = ((1 - g)*p)+(g*nz(L0[1]))
+    L1 = (-g*L0)+nz(L0[1])+(g*nz(L1[1]))
+    L2 = (-g*L1)+nz(L1[1])+(g*nz(L2[1]))
+    L3 = (-g*L2)+nz(L2[1])+(g*nz(L3[1]))
 
-        set_option("display.max_rows", 2000)
-        set_option("display.max_columns", 8)
+    Original Pinescript Block 2
+    cu=(L0 > L1? L0 - L1: 0) + (L1 > L2? L1 - L2: 0) + (L2 > L3? L2 - L3: 0)
+    cd=(L0 < L1? L1 - L0: 0) + (L1 < L2? L2 - L1: 0) + (L2 < L3? L3 - L2: 0)
 
+    Original Pinescript  Block 3
+    lrsi=ema((cu+cd==0? -1: cu+cd)==-1? 0: (cu/(cu+cd==0? -1: cu+cd)), smooth)
+
+    :param dataframe: df
+    :param gamma: Between 0 and 1, default 0.75.
+        A list of gammas computes all of them in one pass over the data.
+    :param smooth: 1 is off. Valid values over 1 are alook back smooth for an ema
+    :param debug: Bool, widens pandas' display options for printing the dataframe.
+        Kept for backwards compatibility.
+    :return: Laguerre RSI:values 0 to +1
+        A 2D array of shape (len(gamma), len(dataframe)) if a list of gammas is passed.
     """
-    Vectorised pandas or numpy calculations are not used
-    in Laguerre as L0 is self referencing.
-    Therefore we use an intertuples loop as next best option.
-    """
-    lrsi_l = []
-    L0, L1, L2, L3 = 0.0, 0.0, 0.0, 0.0
-    for row in df.itertuples(index=True, name="lrsi"):
-        """
-        Original Pine Logic  Block1
-        p = close
-        L0 = ((1 - g)*p)+(g*nz(L0[1]))
-        L1 = (-g*L0)+nz(L0[1])+(g*nz(L1[1]))
-        L2 = (-g*L1)+nz(L1[1])+(g*nz(L2[1]))
-        L3 = (-g*L2)+nz(L2[1])+(g*nz(L3[1]))
-        """
-        # Feed back loop
-        L0_1, L1_1, L2_1, L3_1 = L0, L1, L2, L3
+    import talib as ta
 
-        L0 = (1 - g) * row.close + g * L0_1
-        L1 = -g * L0 + L0_1 + g * L1_1
-        L2 = -g * L1 + L1_1 + g * L2_1
-        L3 = -g * L2 + L2_1 + g * L3_1
+    from technical.kernels import laguerre_rsi
 
-        """ Original Pinescript Block 2
-        cu=(L0 > L1? L0 - L1: 0) + (L1 > L2? L1 - L2: 0) + (L2 > L3? L2 - L3: 0)
-        cd=(L0 < L1? L1 - L0: 0) + (L1 < L2? L2 - L1: 0) + (L2 < L3? L3 - L2: 0)
-        """
-        cu = 0.0
-        cd = 0.0
-        if L0 >= L1:
-            cu = L0 - L1
-        else:
-            cd = L1 - L0
+    if debug:
+        from pandas import set_option
 
-        if L1 >= L2:
-            cu = cu + L1 - L2
-        else:
-            cd = cd + L2 - L1
+        set_option("display.max_rows", 2000)
+        set_option("display.max_columns", 8)
 
-        if L2 >= L3:
-            cu = cu + L2 - L3
-        else:
-            cd = cd + L3 - L2
+    # L0 is self referencing, so the filter runs as a compiled kernel over the close array.
+    close = dataframe["close"].to_numpy(dtype=np.float64)
+    gammas = np.atleast_1d(np.asarray(gamma, dtype=np.float64))
+    lrsi = laguerre_rsi(close, gammas)
 
-        """Original Pinescript  Block 3
-        lrsi=ema((cu+cd==0? -1: cu+cd)==-1? 0: (cu/(cu+cd==0? -1: cu+cd)), smooth)
-        """
-        if (cu + cd) != 0:
-            lrsi_l.append(cu / (cu + cd))
-        else:
-            lrsi_l.append(0)
+    if smooth > 1:
+        for row in lrsi:
+            row[:] = ta.EMA(row, timeperiod=smooth)
 
-    return Series(lrsi_l)
+    if np.ndim(gamma) > 0:
+        return lrsi
+    return Series(lrsi[0], index=dataframe.index)
 
 
 ########################################
 #
 # Madrid Functions
 #
-def mmar(dataframe, matype="EMA", src="close", debug=False):
+def mmar(dataframe, matype="EMA", src="close", debug=False, colors=True):
     """
     Madrid Moving Average Ribbon
 
-    Returns: MMAR
+    Colour states are encoded as int8:
+        2 = lime (uptrend), 1 = green (reentry / downtrend reversal warning),
+        -1 = maroon (short reentry / uptrend reversal warning), -2 = red (downtrend),
+        0 = grey (not enough data)
+
+    :param colors: return the colour names (for plotting) instead of the int8 state codes
+    Returns: MMAR - tuple of Series for the lead MA (5) and the MAs 10 to 90
     """
     """
     Author(Freqtrade): Creslinux
@@ -272,182 +251,56 @@ def mmar(dataframe, matype="EMA", src="close", debug=False):
     plot( ma90, color=maColor(ma90,ma100), style=line, title="MMA90", linewidth=3)
     :return:
     """
-    import talib as ta
-
-    df = dataframe
+    from .overlap_studies import ma_bank
 
     # Default to EMA, allow SMA if passed to def.
-    if matype == "EMA" or matype == "ema":
-        ma = ta.EMA
-    elif matype == "SMA" or matype == "sma":
-        ma = ta.SMA
-    else:
-        ma = ta.EMA
-
-    # Get MAs, also last MA in own column to pass to def later
-    df["ma05"] = ma(df[src], 5)
-    df["ma05l"] = df["ma05"].shift()
-    df["ma10"] = ma(df[src], 10)
-    df["ma10l"] = df["ma10"].shift()
-    df["ma20"] = ma(df[src], 20)
-    df["ma20l"] = df["ma20"].shift()
-    df["ma30"] = ma(df[src], 30)
-    df["ma30l"] = df["ma30"].shift()
-    df["ma40"] = ma(df[src], 40)
-    df["ma40l"] = df["ma40"].shift()
-    df["ma50"] = ma(df[src], 50)
-    df["ma50l"] = df["ma50"].shift()
-    df["ma60"] = ma(df[src], 60)
-    df["ma60l"] = df["ma60"].shift()
-    df["ma70"] = ma(df[src], 70)
-    df["ma70l"] = df["ma70"].shift()
-    df["ma80"] = ma(df[src], 80)
-    df["ma80l"] = df["ma80"].shift()
-    df["ma90"] = ma(df[src], 90)
-    df["ma90l"] = df["ma90"].shift()
-    df["ma100"] = ma(df[src], 100)
-    df["ma100l"] = df["ma100"].shift()
-
-    """ logic for LeadMA
-    : change(ma05)>=0 and ma05>ma100 ? lime    +2
-    : change(ma05)<0  and ma05>ma100 ? maroon  -1
-    : change(ma05)<=0 and ma05<ma100 ? red     -2
-    : change(ma05)>=0 and ma05<ma100 ? green   +1
-    : gray
+    kind = "sma" if matype in ("SMA", "sma") else "ema"
+
+    # Rows: ma05, ma10, ma20, ..., ma90, ma100
+    mas = ma_bank(dataframe, [5, *range(10, 101, 10)], kind=kind, field=src)
+    change = np.full(mas.shape, np.nan)
+    change[:, 1:] = np.diff(mas, axis=1)
+
+    """ logic for LeadMA / MAs
+    : change(ma)>=0 and ma>ma100 ? lime    +2
+    : change(ma)<0  and ma>ma100 ? maroon  -1
+    : change(ma)<=0 and ma<ma100 ? red     -2
+    : change(ma)>=0 and ma<ma100 ? green   +1
+    : gray                                  0
     """
-
-    def leadMAc(x):
-        if (x["ma05"] - x["ma05l"]) >= 0 and (x["ma05"] > x["ma100"]):
-            # Lime: Uptrend.Long trading
-            x["leadMA"] = "lime"
-            return x["leadMA"]
-        elif (x["ma05"] - x["ma05l"]) < 0 and (x["ma05"] > x["ma100"]):
-            # Maroon : Short Reentry (sell the peak) or uptrend reversal warning
-            x["leadMA"] = "maroon"
-            return x["leadMA"]
-        elif (x["ma05"] - x["ma05l"]) <= 0 and (x["ma05"] < x["ma100"]):
-            # Red : Downtrend. Short trading
-            x["leadMA"] = "red"
-            return x["leadMA"]
-        elif (x["ma05"] - x["ma05l"]) >= 0 and (x["ma05"] < x["ma100"]):
-            # Green: Reentry(buy the dip) or downtrend reversal warning
-            x["leadMA"] = "green"
-            return x["leadMA"]
-        else:
-            # If its great it means not enough ticker data for lookback
-            x["leadMA"] = "grey"
-            return x["leadMA"]
-
-    df["leadMA"] = df.apply(leadMAc, axis=1)
-
-    """   Logic for MAs
-    : change(ma)>=0 and ma>ma100 ? lime
-    : change(ma)<0  and ma>ma100 ? maroon
-    : change(ma)<=0 and ma<ma100 ? red
-    : change(ma)>=0 and ma<ma100 ? green
-    : gray
-    """
-
-    def maColor(x, ma: str):
-        col_label = f"{ma}_c"
-        col_label_1 = f"{ma}l"
-
-        if (x[ma] - x[col_label_1]) >= 0 and (x[ma] > x["ma100"]):
-            # Lime: Uptrend.Long trading
-            x[col_label] = "lime"
-            return x[col_label]
-        elif (x[ma] - x[col_label_1]) < 0 and (x[ma] > x["ma100"]):
-            # Maroon : Short Reentry (sell the peak) or uptrend reversal warning
-            x[col_label] = "maroon"
-            return x[col_label]
-
-        elif (x[ma] - x[col_label_1]) <= 0 and (x[ma] < x["ma100"]):
-            # Red : Downtrend. Short trading
-            x[col_label] = "red"
-            return x[col_label]
-
-        elif (x[ma] - x[col_label_1]) >= 0 and (x[ma] < x["ma100"]):
-            # Green: Reentry(buy the dip) or downtrend reversal warning
-            x[col_label] = "green"
-            return x[col_label]
-        else:
-            # If its great it means not enough ticker data for lookback
-            x[col_label] = "grey"
-            return x[col_label]
-
-    df["ma10_c"] = df.apply(maColor, ma="ma10", axis=1)
-    df["ma20_c"] = df.apply(maColor, ma="ma20", axis=1)
-    df["ma30_c"] = df.apply(maColor, ma="ma30", axis=1)
-    df["ma40_c"] = df.apply(maColor, ma="ma40", axis=1)
-    df["ma50_c"] = df.apply(maColor, ma="ma50", axis=1)
-    df["ma60_c"] = df.apply(maColor, ma="ma60", axis=1)
-    df["ma70_c"] = df.apply(maColor, ma="ma70", axis=1)
-    df["ma80_c"] = df.apply(maColor, ma="ma80", axis=1)
-    df["ma90_c"] = df.apply(maColor, ma="ma90", axis=1)
+    above = mas[:-1] > mas[-1]
+    below = mas[:-1] < mas[-1]
+    states = np.select(
+        [
+            (change[:-1] >= 0) & above,
+            (change[:-1] < 0) & above,
+            (change[:-1] <= 0) & below,
+            (change[:-1] >= 0) & below,
+        ],
+        [2, -1, -2, 1],
+        0,
+    ).astype(np.int8)
+
+    names = ["leadMA"] + [f"ma{period}_c" for period in range(10, 100, 10)]
+    if colors:
+        states = _MMAR_COLORS[states + 2]
+    result = tuple(
+        Series(row, index=dataframe.index, name=name) for row, name in zip(states, names)
+    )
 
     if debug:
         from pandas import set_option
 
         set_option("display.max_rows", 10)
-        print(
-            df[
-                [
-                    "date",
-                    "ma05",
-                    "ma05l",
-                    "leadMA",
-                    "ma10",
-                    "ma10l",
-                    "ma10_c",
-                    # "ma20", "ma20l", "ma20_c",
-                    # "ma30", "ma30l", "ma30_c",
-                    # "ma40", "ma40l", "ma40_c",
-                    # "ma50", "ma50l", "ma50_c",
-                    # "ma60", "ma60l", "ma60_c",
-                    # "ma70", "ma70l", "ma70_c",
-                    # "ma80", "ma80l", "ma80_c",
-                    "ma90",
-                    "ma90l",
-                    "ma90_c",
-                    "ma100",
-                ]
-            ].tail(200)
-        )
+        print(DataFrame({s.name: s for s in result}).tail(684))
 
-        print(
-            df[
-                [
-                    "date",
-                    "close",
-                    "leadMA",
-                    "ma10_c",
-                    "ma20_c",
-                    "ma30_c",
-                    "ma40_c",
-                    "ma50_c",
-                    "ma60_c",
-                    "ma70_c",
-                    "ma80_c",
-                    "ma90_c",
-                ]
-            ].tail(684)
-        )
+    return result
 
-    return (
-        df["leadMA"],
-        df["ma10_c"],
-        df["ma20_c"],
-        df["ma30_c"],
-        df["ma40_c"],
-        df["ma50_c"],
-        df["ma60_c"],
-        df["ma70_c"],
-        df["ma80_c"],
-        df["ma90_c"],
-    )
 
+_MMAR_COLORS = np.array(["red", "maroon", "grey", "green", "lime"], dtype=object)
 
-def madrid_sqz(datafame, length=34, src="close", ref=13, sqzLen=5):
+
+def madrid_sqz(datafame, length=34, src="close", ref=13, sqzLen=5, colors=True):
     """
     Squeeze Madrid Indicator
 
@@ -460,7 +313,10 @@ def madrid_sqz(datafame, length=34, src="close", ref=13, sqzLen=5):
     :param src: default close
     :param ref: default 13
     :param sqzLen: default 5
-    :return: df['sqz_cma_c'], df['sqz_rma_c'], df['sqz_sma_c']
+    :param colors: return the colour names (for plotting) instead of the int8 state codes
+    :return: sqz_cma_c, sqz_rma_c, sqz_sma_c as Series.
+        State codes: sqz_cma_c 1 = aqua, -1 = fuchsia; sqz_sma_c 1 = lime, -1 = red;
+        sqz_rma_c 1 = green, 0 = yellow, -1 = maroon
 
 
     There are seven colors used for the study
@@ -501,10 +357,11 @@ def madrid_sqz(datafame, length=34, src="close", ref=13, sqzLen=5):
     refma = ema(src, ref) - ma
     sqzma = ema(src, sqzLen) - ma
     """
-    datafame["sqz_ma"] = ta.EMA(datafame[src], length)
-    datafame["sqz_cma"] = datafame["close"] - datafame["sqz_ma"]
-    datafame["sqz_rma"] = ta.EMA(datafame[src], ref) - datafame["sqz_ma"]
-    datafame["sqz_sma"] = ta.EMA(datafame[src], sqzLen) - datafame["sqz_ma"]
+    src_values = datafame[src].to_numpy(dtype=np.float64)
+    ma = ta.EMA(src_values, length)
+    cma = datafame["close"].to_numpy(dtype=np.float64) - ma
+    rma = ta.EMA(src_values, ref) - ma
+    sma = ta.EMA(src_values, sqzLen) - ma
 
     """ Original code logic
     plotcandle(0, closema, 0, closema, color=closema >= 0?aqua: fuchsia)
@@ -514,46 +371,21 @@ def madrid_sqz(datafame, length=34, src="close", ref=13, sqzLen=5):
     (refma >= 0 and closema < refma) or (refma < 0 and closema > refma) ? yellow:
     refma >= 0 ? green: maroon)
     """
+    cma_c = np.where(cma >= 0, 1, -1).astype(np.int8)
+    sma_c = np.where(sma >= 0, 1, -1).astype(np.int8)
+    yellow = ((rma >= 0) & (cma < rma)) | ((rma < 0) & (cma > rma))
+    rma_c = np.where(yellow, 0, np.where(rma >= 0, 1, -1)).astype(np.int8)
 
-    # print(datafame[['sqz_cma', 'sqz_rma', 'sqz_sma']])
-
-    def sqz_cma_c(x):
-        if x["sqz_cma"] >= 0:
-            x["sqz_cma_c"] = "aqua"
-            return x["sqz_cma_c"]
-        else:
-            x["sqz_cma_c"] = "fuchsia"
-            return x["sqz_cma_c"]
-
-    datafame["sqz_cma_c"] = datafame.apply(sqz_cma_c, axis=1)
-
-    def sqz_sma_c(x):
-        if x["sqz_sma"] >= 0:
-            x["sqz_sma_c"] = "lime"
-            return x["sqz_sma_c"]
-        else:
-            x["sqz_sma_c"] = "red"
-            return x["sqz_sma_c"]
-
-    datafame["sqz_sma_c"] = datafame.apply(sqz_sma_c, axis=1)
-
-    def sqz_rma_c(x):
-        if (x["sqz_rma"] >= 0 and x["sqz_cma"] < x["sqz_rma"]) or (
-            x["sqz_rma"] < 0 and x["sqz_cma"] > x["sqz_rma"]
-        ):
-            x["sqz_rma_c"] = "yellow"
-            return x["sqz_rma_c"]
-        elif x["sqz_rma"] >= 0:
-            x["sqz_rma_c"] = "green"
-            return x["sqz_rma_c"]
-        else:
-            x["sqz_rma_c"] = "maroon"
-            return x["sqz_rma_c"]
-
-    datafame["sqz_rma_c"] = datafame.apply(sqz_rma_c, axis=1)
+    if colors:
+        cma_c = np.array(["fuchsia", None, "aqua"], dtype=object)[cma_c + 1]
+        sma_c = np.array(["red", None, "lime"], dtype=object)[sma_c + 1]
+        rma_c = np.array(["maroon", "yellow", "green"], dtype=object)[rma_c + 1]
 
-    # print(datafame[['sqz_cma_c', 'sqz_rma_c', 'sqz_sma_c']])
-    return datafame["sqz_cma_c"], datafame["sqz_rma_c"], datafame["sqz_sma_c"]
+    return (
+        Series(cma_c, index=datafame.index, name="sqz_cma_c"),
+        Series(rma_c, index=datafame.index, name="sqz_rma_c"),
+        Series(sma_c, index=datafame.index, name="sqz_sma_c"),
+    )
 
 
 ########################################
@@ -570,16 +402,27 @@ def osc(dataframe, periods=14) -> ndarray:
         OSC (i) = SMA (DM, N) / (SMA (DM, N) + SMA (DMn, N)).
 
     :param dataframe:
-    :param periods:
-    :return:
+    :param periods: period, or a list of periods
+    :return: Series - or a 2D array with one row per period if a list of periods is passed
     """
-    df = dataframe
-    df["DM"] = (df["high"] - df["high"].shift()).apply(lambda x: max(x, 0))
-    df["DMn"] = (df["low"].shift() - df["low"]).apply(lambda x: max(x, 0))
-    return Series.rolling_mean(df.DM, periods) / (
-        Series.rolling_mean(df.DM, periods) + Series.rolling_mean(df.DMn, periods)
+    moves = DataFrame(
+        {
+            "DM": dataframe["high"].diff().clip(lower=0),
+            "DMn": (-dataframe["low"].diff()).clip(lower=0),
+        }
     )
 
+    result = np.empty((len(np.atleast_1d(periods)), len(moves)))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for row, period in zip(result, np.atleast_1d(periods)):
+            # DM and DMn are averaged in the same rolling pass
+            dm, dmn = moves.rolling(period).mean().to_numpy().T
+            row[:] = dm / (dm + dmn)
+
+    if np.ndim(periods) == 0:
+        return Series(result[0], index=dataframe.index)
+    return result
+
 
 def vfi(dataframe, length=130, coef=0.2, vcoef=2.5, signalLength=5, smoothVFI=False):
     """
@@ -652,49 +495,34 @@ def vfi(dataframe, length=130, coef=0.2, vcoef=2.5, signalLength=5, smoothVFI=Fa
     """
 
     import talib as ta
-    from numpy import where
-
-    df = dataframe
-    # Add hlc3 and populate inter to the dataframe
-    df["hlc"] = ((df["high"] + df["low"] + df["close"]) / 3).astype(float)
-    df["inter"] = df["hlc"].map(math.log) - df["hlc"].shift(+1).map(math.log)
-    df["vinter"] = df["inter"].rolling(30).std(ddof=0)
-    df["cutoff"] = coef * df["vinter"] * df["close"]
+
+    high = dataframe["high"].to_numpy(dtype=np.float64)
+    low = dataframe["low"].to_numpy(dtype=np.float64)
+    close = dataframe["close"].to_numpy(dtype=np.float64)
+    volume = dataframe["volume"].to_numpy(dtype=np.float64)
+
+    hlc = (high + low + close) / 3
+    inter = np.diff(np.log(hlc), prepend=np.nan)
+    vinter = Series(inter).rolling(30).std(ddof=0).to_numpy()
+    cutoff = coef * vinter * close
     # Vave is to be calculated on volume of the past bar
-    df["vave"] = ta.SMA(df["volume"].shift(+1), timeperiod=length)
-    df["vmax"] = df["vave"] * vcoef
-    df["vc"] = where((df["volume"] < df["vmax"]), df["volume"], df["vmax"])
-    df["mf"] = df["hlc"] - df["hlc"].shift(+1)
-
-    # more logic for vcp, so create a def and df.apply it
-    def vcp(x):
-        if x["mf"] > x["cutoff"]:
-            return x["vc"]
-        elif x["mf"] < -(x["cutoff"]):
-            return -(x["vc"])
-        else:
-            return 0
+    vave = ta.SMA(np.concatenate(([np.nan], volume[:-1])), timeperiod=length)
+    vmax = vave * vcoef
+    vc = np.where(volume < vmax, volume, vmax)
+    mf = np.diff(hlc, prepend=np.nan)
+    vcp = np.where(mf > cutoff, vc, np.where(mf < -cutoff, -vc, 0.0))
 
-    df["vcp"] = df.apply(vcp, axis=1)
     # vfi has a smooth option passed over def call, sma if set
-    df["vfi"] = (df["vcp"].rolling(length).sum()) / df["vave"]
+    vfi = Series(vcp).rolling(length).sum().to_numpy() / vave
     if smoothVFI is True:
-        df["vfi"] = ta.SMA(df["vfi"], timeperiod=3)
-    df["vfima"] = ta.EMA(df["vfi"], signalLength)
-    df["vfi_hist"] = df["vfi"] - df["vfima"]
-
-    # clean up columns used vfi calculation but not needed for strategy
-    df.drop("hlc", axis=1, inplace=True)
-    df.drop("inter", axis=1, inplace=True)
-    df.drop("vinter", axis=1, inplace=True)
-    df.drop("cutoff", axis=1, inplace=True)
-    df.drop("vave", axis=1, inplace=True)
-    df.drop("vmax", axis=1, inplace=True)
-    df.drop("vc", axis=1, inplace=True)
-    df.drop("mf", axis=1, inplace=True)
-    df.drop("vcp", axis=1, inplace=True)
+        vfi = ta.SMA(vfi, timeperiod=3)
+    vfima = ta.EMA(vfi, signalLength)
 
-    return df["vfi"], df["vfima"], df["vfi_hist"]
+    return (
+        Series(vfi, index=dataframe.index, name="vfi"),
+        Series(vfima, index=dataframe.index, name="vfima"),
+        Series(vfi - vfima, index=dataframe.index, name="vfi_hist"),
+    )
 
 
 def stc(dataframe, fast=23, slow=50, length=10):
@@ -707,17 +535,28 @@ def stc(dataframe, fast=23, slow=50, length=10):
     # %D (MACD) = %DV (MACD, 10);
     # Schaff = 100 x (MACD – %K (MACD)) / (%D (MACD) – %K (MACD))
 
-    import talib.abstract as ta
+    from technical.kernels import schaff_trend_cycle
+
+    result = schaff_trend_cycle(dataframe["close"], [(fast, slow, length)])[0]
+    return Series(result, index=dataframe.index, name="stc")
+
+
+def stc_batch(dataframe, params):
+    """
+    Schaff Trend Cycle for several parameter sets in one call, e.g. for optimisation runs.
+    Each EMA period is computed once.
+
+    Usage:
+        result = stc_batch(dataframe, [(23, 50, 10), (12, 26, 10)])
+        dataframe['stc'] = result[0]
 
-    MACD = ta.EMA(dataframe, timeperiod=fast) - ta.EMA(dataframe, timeperiod=slow)
-    STOK = (
-        (MACD - MACD.rolling(window=length).min())
-        / (MACD.rolling(window=length).max() - MACD.rolling(window=length).min())
-    ) * 100
-    STOD = STOK.rolling(window=length).mean()
-    dataframe["stc"] = 100 * (MACD - (STOK * MACD)) / ((STOD * MACD) - (STOK * MACD))
+    :param dataframe: Dataframe containing OHLCV data
+    :param params: list of (fast, slow, length) triples (see stc)
+    :return: 2D array of shape (len(params), len(dataframe))
+    """
+    from technical.kernels import schaff_trend_cycle
 
-    return dataframe["stc"]
+    return schaff_trend_cycle(dataframe["close"], params)
 
 
 def vpcii(dataframe, period_short=5, period_long=20, hist=8, hist_long=30):
@@ -763,7 +602,9 @@ def vpci(dataframe, period_short=5, period_long=20):
     return vpci
 
 
-def fibonacci_retracements(df, field="close", window: int = 120) -> DataFrame:
+def fibonacci_retracements(
+    df, field="close", window: int = 120, position: bool = False
+) -> DataFrame:
     """
     Fibonacci retracement levels as a step indicator.
 
@@ -774,56 +615,76 @@ def fibonacci_retracements(df, field="close", window: int = 120) -> DataFrame:
         Use `window=0` to determine the high/low from the whole dataframe (the
         behaviour prior to this parameter being introduced) - this has a lookahead
         bias and must not be used for backtesting.
-    :return: series with the fibonacci level each candle exceeds
+        A list of windows computes all of them in one call.
+    :param position: return the position of each candle between the high (1.0) and
+        the low (0.0) instead of the fibonacci level it exceeds
+    :return: series with the fibonacci level each candle exceeds - or a 2D array of
+        shape (len(window), len(df)) if a list of windows is passed
     """
     # Common Fibonacci replacement thresholds (ascending):
     # 0.0, F_n / F_{n+3}, F_n / F_{n+2}, 0.5, F_n / F_{n+1}, sqrt(F_n / F_{n+1}), 1.0
     thresholds = np.array([0.0, 0.236, 0.382, 0.5, 0.618, 0.786, 1.0])
 
-    if window:
-        window_min = df[field].rolling(window=window, min_periods=window).min()
-        window_max = df[field].rolling(window=window, min_periods=window).max()
-    else:
-        window_min, window_max = df[field].min(), df[field].max()
+    values = df[field].to_numpy(dtype=np.float64)
+    windows = np.atleast_1d(np.asarray(window, dtype=np.int64))
+    window_min = np.empty((len(windows), len(values)))
+    window_max = np.empty((len(windows), len(values)))
+    rolling = windows > 0
+    if rolling.any():
+        from technical.kernels import rolling_max, rolling_min
+
+        # One pass over the data for all windows
+        window_min[rolling] = rolling_min(values, windows[rolling].tolist())
+        window_max[rolling] = rolling_max(values, windows[rolling].tolist())
+    if not rolling.all():
+        # Whole dataframe (window=0) - NaN without any data
+        has_data = not np.isnan(values).all()
+        window_min[~rolling] = np.nanmin(values) if has_data else np.nan
+        window_max[~rolling] = np.nanmax(values) if has_data else np.nan
     # fib_levels = [window_min + t * (window_max - window_min) for t in thresholds]
 
     # Scale data to match to thresholds
-    # Can be returned instead if one is looking at the movement between levels
-    data = (df[field] - window_min) / (window_max - window_min)
+    data = (values - window_min) / (window_max - window_min)
 
-    # Otherwise, we return a step indicator showing the fibonacci level
-    # which each candle exceeds.
-    # data is scaled to [0, 1], so searchsorted always yields a valid threshold.
-    values = data.to_numpy()
-    idx = np.searchsorted(thresholds, values, side="right") - 1
-    steps = np.where(np.isnan(values), np.nan, thresholds[idx.clip(0)])
+    if not position:
+        # Otherwise, we return a step indicator showing the fibonacci level
+        # which each candle exceeds.
+        # data is scaled to [0, 1], so searchsorted always yields a valid threshold.
+        idx = np.searchsorted(thresholds, data, side="right") - 1
+        data = np.where(np.isnan(data), np.nan, thresholds[idx.clip(0)])
 
-    return Series(steps, index=data.index, name=data.name)
+    if np.ndim(window) == 0:
+        return Series(data[0], index=df.index, name=field)
+    return data
 
 
-def return_on_investment(dataframe, decimals=2) -> DataFrame:
+def return_on_investment(dataframe, decimals=2, signals="buy") -> DataFrame:
     """
     Simple ROI indicator.
+    ROI of each candle against the close of the most recent entry signal (value 1).
+    Candles ahead of the first entry are 0.
 
     :param dataframe:
     :param decimals:
-    :return:
+    :param signals: column with the entry signals - or a list of columns,
+        e.g. the entries of several strategy variants
+    :return: dataframe with the additional column "roi" -
+        or a 2D array with one row of ROI per signal column if a list of columns is passed
     """
 
-    close = np.array(dataframe["close"])
-    buy = np.array(dataframe["buy"])
-    buy_idx = np.where(buy == 1)[0]
-    roi = np.zeros(len(close))
-    if len(buy_idx) > 0:
-        # get chunks starting with a buy signal
-        # everything before the first buy signal is discarded
-        buy_chunks = np.split(close, buy_idx)[1:]
-        for idx, chunk in zip(buy_idx, buy_chunks):
-            # round ROI to avoid float accuracy problems
-            chunk_roi = np.round(100.0 * (chunk / chunk[0] - 1.0), decimals)
-            roi[idx : idx + len(chunk)] = chunk_roi
-
-    dataframe["roi"] = roi
+    close = dataframe["close"].to_numpy(dtype=np.float64)
+    entries = dataframe[np.atleast_1d(signals)].to_numpy().T == 1
+
+    # Index of the last entry for every candle, forward filled
+    candles = np.arange(len(close))
+    last_entry = np.maximum.accumulate(np.where(entries, candles, -1), axis=-1)
+    entry_close = close[last_entry.clip(0)]
+    # round ROI to avoid float accuracy problems
+    roi = np.where(last_entry >= 0, np.round(100.0 * (close / entry_close - 1.0), decimals), 0.0)
+
+    if np.ndim(signals) > 0:
+        return roi
+    dataframe["roi"] = roi[0]
 
     return dataframe
 
@@ -840,29 +701,55 @@ def td_sequential(dataframe):
             content: TD Sequential:values -9 to +9
     """
 
-    # Copy DF
-    df = dataframe.copy()
+    from technical.kernels import td_sequential as td_kernel
+    from technical.kernels import td_state
+
+    close = dataframe["close"].to_numpy(dtype=np.float64).reshape(1, -1)
+    volume = dataframe["volume"].to_numpy(dtype=np.float64).reshape(1, -1)
+    dataframe.loc[:, "TD_count"] = td_kernel(close, volume, td_state())[0]
+    return dataframe
 
-    condv = df["volume"] > 0
-    cond1 = df["close"] > df["close"].shift(4)
-    cond2 = df["close"] < df["close"].shift(4)
 
-    df["cond_tdb_a"] = (df.groupby(((cond1)[condv]).cumsum()).cumcount() % 10 == 0).cumsum()
-    df["cond_tds_a"] = (df.groupby(((cond2)[condv]).cumsum()).cumcount() % 10 == 0).cumsum()
-    df["cond_tdb_b"] = (df.groupby(((cond1)[condv]).cumsum()).cumcount() % 10 != 0).cumsum()
-    df["cond_tds_b"] = (df.groupby(((cond2)[condv]).cumsum()).cumcount() % 10 != 0).cumsum()
+class TDSequential:
+    """
+    Streaming TD Sequential counter, for live candles.
 
-    df["tdb_a"] = df.groupby(df["cond_tdb_a"]).cumcount()
-    df["tds_a"] = df.groupby(df["cond_tds_a"]).cumcount()
+    Usage:
+        td = TDSequential()
+        td.update(dataframe["close"], dataframe["volume"])  # warm up on history
+        count = td.update(close, volume)  # then once per new candle
 
-    df["tdb_b"] = df.groupby(df["cond_tdb_b"]).cumcount()
-    df["tds_b"] = df.groupby(df["cond_tds_b"]).cumcount()
+    Counts are the same as td_sequential() over the full history.
 
-    df["tdc"] = df["tds_a"] - df["tdb_a"]
-    df["tdc"] = df.apply((lambda x: x["tdb_b"] % 9 if x["tdb_b"] > 9 else x["tdc"]), axis=1)
-    df["tdc"] = df.apply((lambda x: (x["tds_b"] % 9) * -1 if x["tds_b"] > 9 else x["tdc"]), axis=1)
-    dataframe.loc[:, "TD_count"] = df["tdc"]
-    return dataframe
+    :param rows: number of series (pairs) updated together. Each update takes one value
+        (or one array of consecutive candles) per series.
+    """
+
+    def __init__(self, rows: int = 1):
+        from technical.kernels import td_state
+
+        self.state = td_state(rows)
+
+    def update(self, close, volume):
+        """
+        Feed new candles and return their TD counts.
+
+        :param close: new close(s) - scalar or 1D array for a single series,
+            otherwise an array of shape (rows,) or (rows, candles)
+        :param volume: new volume(s), same shape as close
+        :return: TD count(s), same shape as close
+        """
+        from technical.kernels import td_sequential as td_kernel
+
+        close = np.asarray(close, dtype=np.float64)
+        volume = np.asarray(volume, dtype=np.float64)
+        rows = len(self.state)
+        result = td_kernel(
+            np.ascontiguousarray(close.reshape(rows, -1)),
+            np.ascontiguousarray(volume.reshape(rows, -1)),
+            self.state,
+        ).reshape(close.shape)
+        return result if result.ndim else int(result)
 
 
 def TKE(dataframe, *, length=14, emaperiod=5):
@@ -884,25 +771,45 @@ def TKE(dataframe, *, length=14, emaperiod=5):
     Usage:
         `dataframe['TKE'], dataframe['TKEema'] = TKE1(dataframe)`
     """
-    import talib.abstract as ta
+    import talib
 
-    df = dataframe.copy()
-    # TKE=(RSI+STOCHASTIC+ULTIMATE OSCILLATOR+MFI+WIILIAMS %R+MOMENTUM+CCI)/7
-    df["rsi"] = ta.RSI(df, timeperiod=length)
-    df["stoch"] = (
-        100
-        * (df["close"] - df["low"].rolling(window=length).min())
-        / (df["high"].rolling(window=length).max() - df["low"].rolling(window=length).min())
+    from technical.kernels import rolling_max, rolling_min
+
+    high, low, close, volume = (
+        dataframe[column].to_numpy(dtype=np.float64)
+        for column in ("high", "low", "close", "volume")
     )
+    # Rolling high / low window, shared by the stochastic and Williams %R
+    highest_high = rolling_max(high, length)
+    lowest_low = rolling_min(low, length)
+    high_low = highest_high - lowest_low
 
-    df["ultosc"] = ta.ULTOSC(df, timeperiod1=7, timeperiod2=14, timeperiod3=28)
-    df["mfi"] = ta.MFI(df, timeperiod=length)
-    df["willr"] = ta.WILLR(df, timeperiod=length)
-    df["mom"] = ta.ROCR100(df, timeperiod=length)
-    df["cci"] = ta.CCI(df, timeperiod=length)
-    df["TKE"] = df[["rsi", "stoch", "ultosc", "mfi", "willr", "mom", "cci"]].mean(axis="columns")
-    df["TKEema"] = ta.EMA(df["TKE"], timeperiod=emaperiod)
-    return df["TKE"], df["TKEema"]
+    # TKE=(RSI+STOCHASTIC+ULTIMATE OSCILLATOR+MFI+WIILIAMS %R+MOMENTUM+CCI)/7
+    components = np.empty((7, len(close)))
+    components[0] = talib.RSI(close, timeperiod=length)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        components[1] = 100 * (close - lowest_low) / high_low
+        components[2] = talib.ULTOSC(
+            high, low, close, timeperiod1=7, timeperiod2=14, timeperiod3=28
+        )
+        components[3] = talib.MFI(high, low, close, volume, timeperiod=length)
+        # Williams %R is 0 on a flat window, like TA-Lib
+        np.divide(highest_high - close, high_low / -100, out=components[4])
+    components[4][high_low == 0] = 0
+    components[5] = talib.ROCR100(close, timeperiod=length)
+    components[6] = talib.CCI(high, low, close, timeperiod=length)
+
+    # Mean over the available components, like DataFrame.mean()
+    count = len(components) - np.isnan(components).sum(axis=0)
+    tke = np.nansum(components, axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        np.divide(tke, count, out=tke)
+    tke[count == 0] = np.nan
+    tke_ema = talib.EMA(tke, timeperiod=emaperiod)
+    return (
+        Series(tke, index=dataframe.index, name="TKE"),
+        Series(tke_ema, index=dataframe.index, name="TKEema"),
+    )
 
 
 def vwmacd(dataframe, *, fastperiod=12, slowperiod=26, signalperiod=9):
@@ -991,35 +898,35 @@ def VIDYA(dataframe, length=9, select=True):
     receives a weight increment adapted to the current market's volatility .
 
     select: True = CMO, False= StdDev as volatility index
+    length: a list of lengths computes all of them in one call, returning a 2D array
+      of shape (len(length), len(dataframe))
     usage:
       dataframe['VIDYA'] = VIDYA(dataframe)
     """
-    df = dataframe.copy()
-    alpha = 2 / (length + 1)
-    df["momm"] = df["close"].diff()
-    df["m1"] = np.where(df["momm"] >= 0, df["momm"], 0.0)
-    df["m2"] = np.where(df["momm"] >= 0, 0.0, -df["momm"])
+    from technical.kernels import vidya
 
-    df["sm1"] = df["m1"].rolling(length).sum()
-    df["sm2"] = df["m2"].rolling(length).sum()
+    close = dataframe["close"].astype("float64")
+    lengths = np.atleast_1d(length)
 
-    df["chandeMO"] = 100 * (df["sm1"] - df["sm2"]) / (df["sm1"] + df["sm2"])
-    if select:
-        df["k"] = abs(df["chandeMO"]) / 100
-    else:
-        df["k"] = df["close"].rolling(length).std()
+    momm = close.diff()
+    m1 = Series(np.where(momm >= 0, momm, 0.0))
+    m2 = Series(np.where(momm >= 0, 0.0, -momm))
 
-    cols = ["momm", "m1", "m2", "sm1", "sm2", "chandeMO", "k"]
-    df.loc[:, cols] = df.loc[:, cols].fillna(0.0)
+    k = np.empty((len(lengths), len(close)))
+    for row, window in zip(k, lengths):
+        if select:
+            sm1 = m1.rolling(window).sum()
+            sm2 = m2.rolling(window).sum()
+            row[:] = abs(100 * (sm1 - sm2) / (sm1 + sm2)) / 100
+        else:
+            row[:] = close.rolling(window).std().to_numpy()
+    k[np.isnan(k)] = 0.0
 
-    df["VIDYA"] = 0.0
-    for i in range(length, len(df)):
-        df.at[df.index[i], "VIDYA"] = (
-            alpha * df["k"].iat[i] * df["close"].iat[i]
-            + (1 - alpha * df["k"].iat[i]) * df["VIDYA"].iat[i - 1]
-        )
+    result = vidya(close.to_numpy(), k, 2 / (lengths + 1), lengths)
 
-    return df["VIDYA"]
+    if np.ndim(length) > 0:
+        return result
+    return Series(result[0], index=dataframe.index, name="VIDYA")
 
 
 def MADR(dataframe, length=21, stds_dist=2, matype="sma"):
@@ -1122,6 +1029,58 @@ def SSLChannels(dataframe, length=10, mode="sma"):
     return df["sslDown"], df["sslUp"]
 
 
+def _pmax_ma(dataframe, lengths, MAtype, src) -> ndarray:
+    """
+    Moving averages used by PMAX, one row per length
+    """
+    import talib.abstract as ta
+
+    # MAtype==1 --> EMA
+    # MAtype==2 --> DEMA
+    # MAtype==3 --> T3
+    # MAtype==4 --> SMA
+    # MAtype==5 --> VIDYA
+    # MAtype==6 --> TEMA
+    # MAtype==7 --> WMA
+    # MAtype==8 --> VWMA
+    if MAtype == 5:
+        # VIDYA computes all lengths in one call
+        return VIDYA(dataframe, length=list(lengths))
+
+    # VIDYA, WMA and VWMA ignore src
+    if MAtype in (7, 8):
+        masrc = None
+    elif src == 1:
+        masrc = dataframe["close"]
+    elif src == 2:
+        masrc = (dataframe["high"] + dataframe["low"]) / 2
+    elif src == 3:
+        masrc = (dataframe["high"] + dataframe["low"] + dataframe["close"] + dataframe["open"]) / 4
+    else:
+        raise ValueError(f"src {src} not supported.")
+
+    ma = np.empty((len(lengths), len(dataframe)))
+    for row, length in zip(ma, lengths):
+        if MAtype == 1:
+            row[:] = ta.EMA(masrc, timeperiod=length)
+        elif MAtype in (2, 9):
+            # Compatibility for ZEMA (https://github.com/freqtrade/technical/pull/356 for details)
+            row[:] = ta.DEMA(masrc, timeperiod=length)
+        elif MAtype == 3:
+            row[:] = ta.T3(masrc, timeperiod=length)
+        elif MAtype == 4:
+            row[:] = ta.SMA(masrc, timeperiod=length)
+        elif MAtype == 6:
+            row[:] = ta.TEMA(masrc, timeperiod=length)
+        elif MAtype == 7:
+            row[:] = ta.WMA(dataframe, timeperiod=length)
+        elif MAtype == 8:
+            row[:] = vwma(dataframe, length)
+        else:
+            raise ValueError(f"MAtype {MAtype} not supported.")
+    return ma
+
+
 def PMAX(dataframe, period=10, multiplier=3, length=12, MAtype=1, src=1):
     """
     Function to compute PMAX
@@ -1143,111 +1102,22 @@ def PMAX(dataframe, period=10, multiplier=3, length=12, MAtype=1, src=1):
     """
     import talib.abstract as ta
 
+    from technical.kernels import pmax
+
     df = dataframe.copy()
-    mavalue = "MA_" + str(MAtype) + "_" + str(length)
     atr = "ATR_" + str(period)
     df[atr] = ta.ATR(df, timeperiod=period)
     pm = "pm_" + str(period) + "_" + str(multiplier) + "_" + str(length) + "_" + str(MAtype)
     pmx = "pmX_" + str(period) + "_" + str(multiplier) + "_" + str(length) + "_" + str(MAtype)
-    # MAtype==1 --> EMA
-    # MAtype==2 --> DEMA
-    # MAtype==3 --> T3
-    # MAtype==4 --> SMA
-    # MAtype==5 --> VIDYA
-    # MAtype==6 --> TEMA
-    # MAtype==7 --> WMA
-    # MAtype==8 --> VWMA
-    if src == 1:
-        masrc = df["close"]
-    elif src == 2:
-        masrc = (df["high"] + df["low"]) / 2
-    elif src == 3:
-        masrc = (df["high"] + df["low"] + df["close"] + df["open"]) / 4
-    if MAtype == 1:
-        df[mavalue] = ta.EMA(masrc, timeperiod=length)
-    elif MAtype in (2, 9):
-        # Compatibility for ZEMA (https://github.com/freqtrade/technical/pull/356 for details)
-        df[mavalue] = ta.DEMA(masrc, timeperiod=length)
-    elif MAtype == 3:
-        df[mavalue] = ta.T3(masrc, timeperiod=length)
-    elif MAtype == 4:
-        df[mavalue] = ta.SMA(masrc, timeperiod=length)
-    elif MAtype == 5:
-        df[mavalue] = VIDYA(df, length=length)
-    elif MAtype == 6:
-        df[mavalue] = ta.TEMA(masrc, timeperiod=length)
-    elif MAtype == 7:
-        df[mavalue] = ta.WMA(df, timeperiod=length)
-    elif MAtype == 8:
-        df[mavalue] = vwma(df, length)
-    else:
-        raise ValueError(f"MAtype {MAtype} not supported.")
-    # Compute basic upper and lower bands
-    df["basic_ub"] = df[mavalue] + (multiplier * df[atr])
-    df["basic_lb"] = df[mavalue] - (multiplier * df[atr])
-    # Compute final upper and lower bands
-    df["final_ub"] = 0.00
-    df["final_lb"] = 0.00
-    for i in range(period, len(df)):
-        df.at[df.index[i], "final_ub"] = (
-            df["basic_ub"].iat[i]
-            if (
-                df["basic_ub"].iat[i] < df["final_ub"].iat[i - 1]
-                or df[mavalue].iat[i - 1] > df["final_ub"].iat[i - 1]
-            )
-            else df["final_ub"].iat[i - 1]
-        )
-
-        df.at[df.index[i], "final_lb"] = (
-            df["basic_lb"].iat[i]
-            if (
-                df["basic_lb"].iat[i] > df["final_lb"].iat[i - 1]
-                or df[mavalue].iat[i - 1] < df["final_lb"].iat[i - 1]
-            )
-            else df["final_lb"].iat[i - 1]
-        )
 
-    # Set the Pmax value
-    df[pm] = 0.00
-    for i in range(period, len(df)):
-        df.at[df.index[i], pm] = (
-            df["final_ub"].iat[i]
-            if (
-                df[pm].iat[i - 1] == df["final_ub"].iat[i - 1]
-                and df[mavalue].iat[i] <= df["final_ub"].iat[i]
-            )
-            else (
-                df["final_lb"].iat[i]
-                if (
-                    df[pm].iat[i - 1] == df["final_ub"].iat[i - 1]
-                    and df[mavalue].iat[i] > df["final_ub"].iat[i]
-                )
-                else (
-                    df["final_lb"].iat[i]
-                    if (
-                        df[pm].iat[i - 1] == df["final_lb"].iat[i - 1]
-                        and df[mavalue].iat[i] >= df["final_lb"].iat[i]
-                    )
-                    else (
-                        df["final_ub"].iat[i]
-                        if (
-                            df[pm].iat[i - 1] == df["final_lb"].iat[i - 1]
-                            and df[mavalue].iat[i] < df["final_lb"].iat[i]
-                        )
-                        else 0.00
-                    )
-                )
-            )
-        )
+    ma = _pmax_ma(df, [length], MAtype, src)
+    pm_values, direction = pmax(
+        ma, df[atr].to_numpy(dtype=np.float64), np.array([multiplier], dtype=np.float64), period
+    )
 
+    df[pm] = pm_values[0]
     # Mark the trend direction up/down
-    df[pmx] = np.where(
-        df[pm] > 0.00,
-        np.where(df[mavalue] < df[pm], "down", "up"),
-        "nan",
-    )
-    # Remove basic and final bands from the columns
-    df.drop(["basic_ub", "basic_lb", "final_ub", "final_lb", mavalue], inplace=True, axis=1)
+    df[pmx] = np.where(direction[0] == 1, "up", np.where(direction[0] == -1, "down", "nan"))
 
     cols = [pm, pmx, atr]
     df.loc[:, cols] = df.loc[:, cols].fillna(0.0)
@@ -1255,6 +1125,43 @@ def PMAX(dataframe, period=10, multiplier=3, length=12, MAtype=1, src=1):
     return df
 
 
+def pmax_grid(dataframe, period=10, multiplier=(3,), length=(12,), MAtype=1, src=1):
+    """
+    PMAX for every combination of multiplier and moving average length, in one call.
+    ATR and each moving average are computed once, and all PMAX lines run through
+    a single pass of the band ratchet.
+
+    Usage:
+        pm, direction = pmax_grid(dataframe, multiplier=[2, 3, 4], length=[10, 12])
+        dataframe['pm_10_3_12_1'] = pm[1, 1]
+
+    :param dataframe: Dataframe containing OHLCV data
+    :param period: ATR period
+    :param multiplier: list of ATR multipliers
+    :param length: list of moving average lengths
+    :param MAtype: type of the moving average (see PMAX)
+    :param src: source of the moving average (see PMAX)
+    :return: Tuple of 2 arrays of shape (len(length), len(multiplier), len(dataframe)):
+        PMAX values, and PMAX direction as int8 (1 = up, -1 = down, 0 = undefined)
+    """
+    import talib.abstract as ta
+
+    from technical.kernels import pmax
+
+    multipliers = np.atleast_1d(np.asarray(multiplier, dtype=np.float64))
+    lengths = [int(x) for x in np.atleast_1d(length)]
+
+    atr = ta.ATR(dataframe, timeperiod=period).to_numpy(dtype=np.float64)
+    ma = _pmax_ma(dataframe, lengths, MAtype, src)
+
+    # One row per (length, multiplier) combination
+    pm, direction = pmax(
+        np.repeat(ma, len(multipliers), axis=0), atr, np.tile(multipliers, len(lengths)), period
+    )
+    shape = (len(lengths), len(multipliers), len(dataframe))
+    return np.nan_to_num(pm, nan=0.0).reshape(shape), direction.reshape(shape)
+
+
 def tv_wma(dataframe: DataFrame, length: int = 9, field="close") -> Series:
     """
     Source: Tradingview "Moving Average Weighted"
@@ -1274,16 +1181,15 @@ def tv_wma(dataframe: DataFrame, length: int = 9, field="close") -> Series:
     else:
         data = dataframe[field]
 
-    norm = 0
-    sum = 0
+    from technical.kernels import wma
 
-    for i in range(1, length - 1):
-        weight = (length - i) * length
-        norm = norm + weight
-        sum = sum + data.shift(i) * weight
+    if length < 3:
+        return 0
 
-    tv_wma = sum / norm if (norm != 0) else 0
-    return tv_wma
+    # Weights length - 1 .. 2 over the previous length - 2 candles, the current one is excluded
+    values = data.shift(1).to_numpy(dtype=np.float64)
+    tv_wma = wma(values.reshape(1, -1), np.array([length - 2]), np.array([1.0]))[0]
+    return Series(tv_wma, index=data.index, name=data.name)
 
 
 def tv_hma(dataframe: DataFrame, length: int = 9, field="close") -> Series:
@@ -1372,27 +1278,44 @@ def tv_trama(dataframe: DataFrame, length: int = 99, field="close") -> Series:
 
     Args :
         dataframe : Pandas Dataframe
-        length : Period of the indicator
-        field : Field to use for the calculation
+        length : Period of the indicator - or a list of periods
+        field : Field to use for the calculation - or a list of fields
 
     Returns :
         series : 'TRAMA' values
+        When a list of lengths and/or fields is passed, all of them are computed in one call
+        and a 2D array (one row per length or field) is returned - or a 3D array of shape
+        (len(length), len(field), len(dataframe)) if both are lists.
     """
 
-    import talib.abstract as ta
-
-    df_len = len(dataframe)
-
-    hh = ta.MAX(dataframe["high"], length)
-    ll = ta.MIN(dataframe["low"], length)
-    hh_or_ll = np.where(np.diff(hh) > 0, 1, 0) + np.where(np.diff(ll) < 0, 1, 0)
+    import talib as ta
 
-    tc = np.zeros(df_len)
-    tc[:-1] = np.nan_to_num(ta.SMA(hh_or_ll.astype(float), length) ** 2)
+    from technical.kernels import trama
 
-    ama = np.zeros(df_len)
-    ama[0] = dataframe[field].iloc[0]
-    for i in range(1, df_len):
-        ama[i] = ama[i - 1] + tc[i - 1] * (dataframe[field].iloc[i] - ama[i - 1])
+    lengths = [int(x) for x in np.atleast_1d(length)]
+    fields = list(np.atleast_1d(field))
+    df_len = len(dataframe)
 
-    return Series(ama)
+    high = dataframe["high"].to_numpy(dtype=np.float64)
+    low = dataframe["low"].to_numpy(dtype=np.float64)
+
+    tc = np.zeros((len(lengths), df_len))
+    for row, period in zip(tc, lengths):
+        hh = ta.MAX(high, period)
+        ll = ta.MIN(low, period)
+        hh_or_ll = np.where(np.diff(hh) > 0, 1, 0) + np.where(np.diff(ll) < 0, 1, 0)
+        row[:-1] = np.nan_to_num(ta.SMA(hh_or_ll.astype(float), period) ** 2)
+
+    src = dataframe[fields].to_numpy(dtype=np.float64).T
+
+    # One row per (length, field) combination
+    ama = trama(np.tile(src, (len(lengths), 1)), np.repeat(tc, len(fields), axis=0))
+    ama = ama.reshape(len(lengths), len(fields), df_len)
+
+    if np.ndim(field) == 0:
+        ama = ama[:, 0]
+    if np.ndim(length) == 0:
+        ama = ama[0]
+    if ama.ndim == 1:
+        return Series(ama, index=dataframe.index)
+    return ama
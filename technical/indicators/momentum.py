@@ -46,7 +46,9 @@ Momentum indicators
 
 # WILLR                Williams' %R
 def williams_percent(dataframe, period=14):
-    highest_high = dataframe["high"].rolling(period).max()
-    lowest_low = dataframe["low"].rolling(period).min()
+    from technical.kernels import rolling_max, rolling_min
+
+    highest_high = rolling_max(dataframe["high"], period)
+    lowest_low = rolling_min(dataframe["low"], period)
     wr = (highest_high - dataframe["close"]) / (highest_high - lowest_low) * -100
-    return wr
+    return wr.rename(None)
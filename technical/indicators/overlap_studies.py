@@ -3,7 +3,7 @@ Overlap studies
 """
 
 import talib.abstract as ta
-from numpy import nan, ndarray
+from numpy import ndarray, ndim
 from pandas import DataFrame, Series
 
 ########################################
@@ -99,24 +99,25 @@ def rma(dataframe: DataFrame, period: int, field="close") -> Series:
 
     The first value is the SMA of the first `period` values;
     subsequent values follow: RMA = (prev_RMA * (period - 1) + current) / period.
+    Leading NaNs (e.g. of `close.diff()`) are skipped, like in pine script: the seed is the
+    SMA of the first `period` consecutive valid values, so each leading NaN delays it by
+    one candle, and a NaN inside the first window restarts it.
+    NaN values after the seed keep the previous value.
 
     :param dataframe: DataFrame with price data
-    :param period: RMA period (must be >= 1)
+    :param period: RMA period (must be >= 1) - or a list of periods, computed in one call
     :param field: Column name to use (default: "close")
     :return: Series containing RMA values
+        A 2D array of shape (len(period), len(dataframe)) if a list of periods is passed.
     """
-    series = dataframe[field].astype("float64")
-
-    if len(series) < period:
-        return Series(nan, index=series.index, name=field)
+    from technical.kernels import wilder_smooth
 
-    # ewm(adjust=False) would seed the recursion with the first value - seed it with the
-    # SMA of the first `period` values instead, and blank the warmup ahead of it.
-    seeded = series.copy()
-    seeded.iloc[: period - 1] = nan
-    seeded.iloc[period - 1] = series.iloc[:period].mean()
+    series = dataframe[field].astype("float64")
+    result = wilder_smooth(series.to_numpy(), period)
 
-    return seeded.ewm(alpha=1.0 / period, adjust=False).mean()
+    if ndim(period) > 0:
+        return result
+    return Series(result, index=series.index, name=field)
 
 
 # HT_TRENDLINE         Hilbert Transform - Instantaneous Trendline
@@ -152,6 +153,24 @@ def tema(dataframe, period, field="close"):
 
 
 # Other Overlap Studies Functions
+def ma_bank(dataframe, periods, kind: str = "ema", field="close") -> ndarray:
+    """
+    Moving averages for several periods at once, e.g. for MA ribbons or period sweeps.
+
+    :param dataframe: DataFrame with price data - or a Series
+    :param periods: list of periods
+    :param kind: "ema", "sma" (same values as TA-Lib), "wma" or "rma" (Wilder's smoothing).
+        "wma" matches TA-Lib's WMA unless NaNs follow the first value - it restarts
+        after a NaN, where TA-Lib stays NaN
+    :param field: Column name to use (default: "close")
+    :return: 2D array of shape (len(periods), len(dataframe))
+    """
+    from technical.kernels import _ma_bank
+
+    series = dataframe if isinstance(dataframe, Series) else dataframe[field]
+    return _ma_bank(series.to_numpy(dtype="float64"), periods, kind)
+
+
 def hull_moving_average(dataframe, period, field="close") -> ndarray:
     # TODO: Remove this helper method, it's a 1:1 call to qtpylib's HMA.
     from technical.qtpylib import hma
@@ -3,6 +3,32 @@ import talib.abstract as ta
 from pandas import DataFrame, Series
 
 
+def _supertrend(dataframe: DataFrame, periods, multipliers):
+    """
+    Runs the SuperTrend ratchet for every (period, multiplier) combination.
+    True range is computed once, and each ATR window once.
+    """
+    from technical.kernels import supertrend as supertrend_kernel
+
+    high = dataframe["high"].to_numpy(dtype=np.float64)
+    low = dataframe["low"].to_numpy(dtype=np.float64)
+    close = dataframe["close"].to_numpy(dtype=np.float64)
+
+    # TR and ATR
+    tr = Series(ta.TRANGE(dataframe["high"], dataframe["low"], dataframe["close"]))
+    atr = np.array([tr.rolling(period).mean().to_numpy() for period in periods])
+
+    # One row per (period, multiplier) combination
+    return supertrend_kernel(
+        high,
+        low,
+        close,
+        np.repeat(atr, len(multipliers), axis=0),
+        np.tile(multipliers, len(periods)),
+        np.repeat(periods, len(multipliers)),
+    )
+
+
 def supertrend(dataframe: DataFrame, period: int = 10, multiplier: int = 3) -> DataFrame:
     """
     Calculate SuperTrend indicator
@@ -15,45 +41,34 @@ def supertrend(dataframe: DataFrame, period: int = 10, multiplier: int = 3) -> D
     Usage:
         `dataframe['ST'], dataframe['STX'] = supertrend(dataframe)`
     """
-    df = dataframe.copy()
-    high = df["high"].values
-    low = df["low"].values
-    close = df["close"].values
-    length = len(df)
-
-    # TR and ATR
-    tr = ta.TRANGE(df["high"], df["low"], df["close"])
-    atr = Series(tr).rolling(period).mean().to_numpy()
-
-    # basic upper / lower bands
-    basic_ub = (high + low) / 2 + multiplier * atr
-    basic_lb = (high + low) / 2 - multiplier * atr
-
-    # final upper / lower bands
-    final_ub = np.zeros(length)
-    final_lb = np.zeros(length)
-
-    for i in range(period, length):
-        final_ub[i] = (
-            basic_ub[i]
-            if basic_ub[i] < final_ub[i - 1] or close[i - 1] > final_ub[i - 1]
-            else final_ub[i - 1]
-        )
-        final_lb[i] = (
-            basic_lb[i]
-            if basic_lb[i] > final_lb[i - 1] or close[i - 1] < final_lb[i - 1]
-            else final_lb[i - 1]
-        )
-
-    # ST calculation
-    st = np.zeros(length)
-    for i in range(period, length):
-        if st[i - 1] == final_ub[i - 1]:
-            st[i] = final_ub[i] if close[i] <= final_ub[i] else final_lb[i]
-        elif st[i - 1] == final_lb[i - 1]:
-            st[i] = final_lb[i] if close[i] >= final_lb[i] else final_ub[i]
+    st, direction = _supertrend(
+        dataframe, np.array([period]), np.array([multiplier], dtype=np.float64)
+    )
 
     # STX direction
-    stx = np.where(st > 0, np.where(close < st, "down", "up"), None)
+    stx = np.where(direction[0] == 1, "up", np.where(direction[0] == -1, "down", None))
+
+    return st[0], stx
+
+
+def supertrend_grid(dataframe: DataFrame, period=(10,), multiplier=(3,)):
+    """
+    Calculate SuperTrend for every combination of ATR period and multiplier, in one call.
+
+    :param dataframe: dataframe containing 'date', 'open', 'high', 'low', 'close', 'volume' columns
+    :param period: list of periods for ATR calculation
+    :param multiplier: list of multipliers for ATR
+    :return: Tuple of two arrays of shape (len(period), len(multiplier), len(dataframe)):
+        SuperTrend value, and SuperTrend direction as int8 (1 = up, -1 = down, 0 = undefined)
+
+    Usage:
+        `st, stx = supertrend_grid(dataframe, period=[7, 10, 14], multiplier=[2, 3])`
+        `dataframe['ST'] = st[1, 1]`
+    """
+    periods = np.atleast_1d(np.asarray(period, dtype=np.int64))
+    multipliers = np.atleast_1d(np.asarray(multiplier, dtype=np.float64))
+
+    st, direction = _supertrend(dataframe, periods, multipliers)
 
-    return st, stx
+    shape = (len(periods), len(multipliers), len(dataframe))
+    return st.reshape(shape), direction.reshape(shape)
@@ -43,17 +43,17 @@ def chopiness(dataframe, period: int = 14):
     https://medium.com/codex/detecting-ranging-and-trending-markets-with-choppiness-index-in-python-1942e6450b58
 
     :param dataframe: Dataframe containing candle data
-    :param period: Period to use for chopiness calculation (defaults to 14)
-    :return: Series containing chopiness calculation :values 0 to +100
-    """
+    :param period: Period to use for chopiness calculation (defaults to 14) - or a list of periods
+    :return: Series containing chopiness calculation :values 0 to +100 -
+        or a 2D array with one row per period if a list of periods is passed
 
-    tr1 = dataframe["high"] - dataframe["low"]
-    tr2 = abs(dataframe["high"] - dataframe["close"].shift(1))
-    tr3 = abs(dataframe["low"] - dataframe["close"].shift(1))
+    Windows containing a missing high or low are NaN. A missing close only affects the true
+    range of the next candle, which falls back to its high - low range.
+    """
+    from technical.kernels import chopiness as chopiness_kernel
 
-    tr = pd.concat([tr1, tr2, tr3], axis=1, join="inner").dropna().max(axis=1)
-    atr = tr.rolling(1).mean()
-    highh = dataframe["high"].rolling(period).max()
-    lowl = dataframe["low"].rolling(period).min()
-    ci = 100 * np.log10((atr.rolling(period).sum()) / (highh - lowl)) / np.log10(period)
-    return ci
+    # The first candle has no previous close - its true range is not used
+    ci = chopiness_kernel(dataframe["high"], dataframe["low"], dataframe["close"], period, start=1)
+    if np.ndim(period) > 0:
+        return ci
+    return pd.Series(ci, index=dataframe.index)
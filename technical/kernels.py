@@ -0,0 +1,924 @@
+"""
+Array kernels for the recursive indicators.
+
+Kernels work on contiguous float64 numpy arrays and never touch a DataFrame.
+They are compiled with numba (a required dependency). Should numba not be importable
+(or NUMBA_DISABLE_JIT be set), they run as plain python loops over the arrays - correct,
+but slow. The rolling window helpers use pandas' rolling windows in that case.
+"""
+
+import numpy as np
+
+try:
+    from numba import config, njit
+
+    JIT_ENABLED = not config.DISABLE_JIT
+except ImportError:  # pragma: no cover
+    JIT_ENABLED = False
+
+    def njit(*args, **kwargs):
+        """
+        numba is not available - return the kernel unchanged.
+        """
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def laguerre_rsi(close, gammas):
+    """
+    Four stage Laguerre filter RSI (John Ehlers), for one or more gamma values.
+
+    :param close: 1D float64 array of prices
+    :param gammas: 1D float64 array of gamma values (between 0 and 1)
+    :return: 2D float64 array of shape (len(gammas), len(close))
+    """
+    n = close.shape[0]
+    out = np.empty((gammas.shape[0], n))
+    for k in range(gammas.shape[0]):
+        g = gammas[k]
+        l0 = l1 = l2 = l3 = 0.0
+        for i in range(n):
+            l0_1, l1_1, l2_1, l3_1 = l0, l1, l2, l3
+
+            l0 = (1 - g) * close[i] + g * l0_1
+            l1 = -g * l0 + l0_1 + g * l1_1
+            l2 = -g * l1 + l1_1 + g * l2_1
+            l3 = -g * l2 + l2_1 + g * l3_1
+
+            cu = 0.0
+            cd = 0.0
+            if l0 >= l1:
+                cu = l0 - l1
+            else:
+                cd = l1 - l0
+
+            if l1 >= l2:
+                cu = cu + l1 - l2
+            else:
+                cd = cd + l2 - l1
+
+            if l2 >= l3:
+                cu = cu + l2 - l3
+            else:
+                cd = cd + l3 - l2
+
+            if (cu + cd) != 0:
+                out[k, i] = cu / (cu + cd)
+            else:
+                out[k, i] = 0.0
+    return out
+
+
+@njit(cache=True)
+def vidya(close, k, alphas, starts):
+    """
+    Variable Index Dynamic Average recursion, for one or more volatility indexes.
+
+    :param close: 1D float64 array of prices
+    :param k: 2D float64 array of volatility indexes, one row per VIDYA line
+    :param alphas: 1D float64 array of smoothing factors, one per row of k
+    :param starts: 1D int array with the first candle to compute, one per row of k.
+        Candles ahead of it are 0.
+    :return: 2D float64 array of the same shape as k
+    """
+    out = np.zeros(k.shape)
+    for j in range(k.shape[0]):
+        alpha = alphas[j]
+        for i in range(starts[j], k.shape[1]):
+            out[j, i] = alpha * k[j, i] * close[i] + (1 - alpha * k[j, i]) * out[j, i - 1]
+    return out
+
+
+@njit(cache=True)
+def pmax(ma, atr, multipliers, start):
+    """
+    PMAX trailing band ratchet, for one or more moving average / multiplier combinations.
+
+    :param ma: 2D float64 array of moving averages, one row per PMAX line
+    :param atr: 1D float64 array of ATR values
+    :param multipliers: 1D float64 array of ATR multipliers, one per row of ma
+    :param start: first candle to compute. Candles ahead of it are 0.
+    :return: Tuple of 2D arrays of the same shape as ma - PMAX values,
+        and PMAX direction as int8 (1 = up, -1 = down, 0 = undefined)
+    """
+    pm = np.zeros(ma.shape)
+    direction = np.zeros(ma.shape, dtype=np.int8)
+    for j in range(ma.shape[0]):
+        multiplier = multipliers[j]
+        final_ub = 0.0
+        final_lb = 0.0
+        for i in range(start, ma.shape[1]):
+            prev_ub = final_ub
+            prev_lb = final_lb
+            basic_ub = ma[j, i] + multiplier * atr[i]
+            basic_lb = ma[j, i] - multiplier * atr[i]
+
+            if basic_ub < prev_ub or ma[j, i - 1] > prev_ub:
+                final_ub = basic_ub
+            if basic_lb > prev_lb or ma[j, i - 1] < prev_lb:
+                final_lb = basic_lb
+
+            prev_pm = pm[j, i - 1]
+            value = ma[j, i]
+            if prev_pm == prev_ub and value <= final_ub:
+                pm[j, i] = final_ub
+            elif (prev_pm == prev_ub and value > final_ub) or (
+                prev_pm == prev_lb and value >= final_lb
+            ):
+                pm[j, i] = final_lb
+            elif prev_pm == prev_lb and value < final_lb:
+                pm[j, i] = final_ub
+
+            if pm[j, i] > 0:
+                direction[j, i] = -1 if value < pm[j, i] else 1
+    return pm, direction
+
+
+@njit(cache=True)
+def supertrend(high, low, close, atr, multipliers, starts):
+    """
+    SuperTrend band ratchet, for one or more ATR / multiplier combinations.
+
+    :param high: 1D float64 array of highs
+    :param low: 1D float64 array of lows
+    :param close: 1D float64 array of closes
+    :param atr: 2D float64 array of ATR values, one row per SuperTrend line
+    :param multipliers: 1D float64 array of ATR multipliers, one per row of atr
+    :param starts: 1D int array with the first candle to compute, one per row of atr.
+        Candles ahead of it are 0.
+    :return: Tuple of 2D arrays of the same shape as atr - SuperTrend values,
+        and SuperTrend direction as int8 (1 = up, -1 = down, 0 = undefined)
+    """
+    st = np.zeros(atr.shape)
+    direction = np.zeros(atr.shape, dtype=np.int8)
+    for j in range(atr.shape[0]):
+        multiplier = multipliers[j]
+        final_ub = 0.0
+        final_lb = 0.0
+        for i in range(starts[j], atr.shape[1]):
+            prev_ub = final_ub
+            prev_lb = final_lb
+            basic_ub = (high[i] + low[i]) / 2 + multiplier * atr[j, i]
+            basic_lb = (high[i] + low[i]) / 2 - multiplier * atr[j, i]
+
+            if basic_ub < prev_ub or close[i - 1] > prev_ub:
+                final_ub = basic_ub
+            if basic_lb > prev_lb or close[i - 1] < prev_lb:
+                final_lb = basic_lb
+
+            prev_st = st[j, i - 1]
+            if prev_st == prev_ub:
+                st[j, i] = final_ub if close[i] <= final_ub else final_lb
+            elif prev_st == prev_lb:
+                st[j, i] = final_lb if close[i] >= final_lb else final_ub
+
+            if st[j, i] > 0:
+                direction[j, i] = -1 if close[i] < st[j, i] else 1
+    return st, direction
+
+
+@njit(cache=True)
+def trama(src, tc):
+    """
+    Trend Regularity Adaptive Moving Average recursion, for one or more series.
+
+    :param src: 2D float64 array of source values, one row per TRAMA line
+    :param tc: 2D float64 array of trend coefficients, same shape as src
+    :return: 2D float64 array of the same shape as src
+    """
+    out = np.empty(src.shape)
+    for j in range(src.shape[0]):
+        if src.shape[1] == 0:
+            break
+        out[j, 0] = src[j, 0]
+        for i in range(1, src.shape[1]):
+            out[j, i] = out[j, i - 1] + tc[j, i - 1] * (src[j, i] - out[j, i - 1])
+    return out
+
+
+@njit(cache=True)
+def _iir_loop(b, a, x, warmup):
+    """
+    Direct form recursion backing iir_filter, used when scipy is not available.
+    """
+    y = np.empty(x.shape)
+    for j in range(x.shape[0]):
+        for i in range(x.shape[1]):
+            if i < warmup:
+                y[j, i] = x[j, i]
+                continue
+            acc = 0.0
+            for k in range(min(b.shape[0], i + 1)):
+                acc += b[k] * x[j, i - k]
+            for k in range(1, min(a.shape[0], i + 1)):
+                acc -= a[k] * y[j, i - k]
+            y[j, i] = acc / a[0]
+    return y
+
+
+def iir_filter(b, a, x, warmup: int = 0) -> np.ndarray:
+    """
+    Recursive (IIR) filter along the last axis of x, following scipy's lfilter convention:
+
+        a[0]*y[i] = b[0]*x[i] + b[1]*x[i-1] + ... - a[1]*y[i-1] - a[2]*y[i-2] - ...
+
+    Uses scipy.signal.lfilter when scipy is installed.
+
+    :param b: numerator (feed forward) coefficients
+    :param a: denominator (feed back) coefficients
+    :param x: 1D array, or 2D array with one series per row
+    :param warmup: number of leading values passed through unfiltered.
+        They seed the recursion instead of zeros.
+    :return: float64 array of the same shape as x
+    """
+    b = np.asarray(b, dtype=np.float64)
+    a = np.asarray(a, dtype=np.float64)
+    x = np.asarray(x, dtype=np.float64)
+    rows = np.atleast_2d(x)
+
+    try:
+        from scipy.signal import lfilter, lfiltic
+    except ImportError:
+        return _iir_loop(b, a, np.ascontiguousarray(rows), warmup).reshape(x.shape)
+
+    y = np.empty(rows.shape)
+    y[:, :warmup] = rows[:, :warmup]
+    if warmup > 0:
+        # Initial filter state from the warmup values - lfiltic expects the most recent first
+        zi = np.array(
+            [
+                lfiltic(b, a, y[j, warmup - 1 :: -1], rows[j, warmup - 1 :: -1])
+                for j in range(len(y))
+            ]
+        )
+    else:
+        zi = np.zeros((len(y), max(len(a), len(b)) - 1))
+    y[:, warmup:] = lfilter(b, a, rows[:, warmup:], axis=-1, zi=zi)[0]
+    return y.reshape(x.shape)
+
+
+@njit(cache=True)
+def _wilder(x, periods):
+    """
+    Wilder smoothing recursion backing wilder_smooth.
+    """
+    out = np.full(x.shape, np.nan)
+    for j in range(x.shape[0]):
+        period = periods[j]
+        # The seed is the SMA of the first `period` consecutive valid values
+        run = 0
+        seed_idx = -1
+        for i in range(x.shape[1]):
+            run = 0 if np.isnan(x[j, i]) else run + 1
+            if run == period:
+                seed_idx = i
+                break
+        if seed_idx < 0:
+            continue
+        value = 0.0
+        for i in range(seed_idx - period + 1, seed_idx + 1):
+            value += x[j, i]
+        value /= period
+        out[j, seed_idx] = value
+        for i in range(seed_idx + 1, x.shape[1]):
+            if not np.isnan(x[j, i]):
+                value = (value * (period - 1) + x[j, i]) / period
+            out[j, i] = value
+    return out
+
+
+def wilder_smooth(x, period) -> np.ndarray:
+    """
+    Wilder's smoothing (RMA / SMMA), as used by RSI and ATR.
+
+    The first value is the SMA of the first `period` consecutive valid values (leading NaNs,
+    or NaNs inside that first window, restart it), subsequent values follow:
+    RMA = (prev_RMA * (period - 1) + current) / period.
+    NaN values after the seed keep the previous value.
+
+    :param x: 1D array, or 2D array with one series per row
+    :param period: smoothing period - or a list of periods, one per row of x.
+        A list of periods with a 1D x smooths x once per period.
+    :return: float64 array - one row per period if a list of periods and a 1D x are passed,
+        otherwise of the same shape as x
+    """
+    x = np.asarray(x, dtype=np.float64)
+    periods = np.atleast_1d(np.asarray(period, dtype=np.int64))
+    rows = np.atleast_2d(x)
+    if x.ndim == 1 and len(periods) > 1:
+        rows = np.repeat(rows, len(periods), axis=0)
+    periods = np.broadcast_to(periods, (len(rows),)).copy()
+
+    result = _wilder(np.ascontiguousarray(rows), periods)
+    if x.ndim == 1 and np.ndim(period) == 0:
+        return result[0]
+    return result
+
+
+TD_STATE_SIZE = 10
+
+
+@njit(cache=True)
+def td_sequential(close, volume, state):
+    """
+    TD Sequential streak counter, for one or more series.
+
+    Runs in a single pass and can be resumed: the counter state is read from and written
+    back to `state`, so a batch run can be continued candle by candle.
+
+    :param close: 2D float64 array of closes, one row per series
+    :param volume: 2D float64 array of volumes, same shape as close
+    :param state: 2D float64 array of shape (len(close), TD_STATE_SIZE), updated in place.
+        Use td_state() for a fresh state.
+    :return: 2D int64 array of TD counts (-9 to +9), same shape as close
+    """
+    out = np.zeros(close.shape, dtype=np.int64)
+    for j in range(close.shape[0]):
+        # Streak counters (buy, sell), candles since the last "a" / "b" setup flag
+        # (buy, sell), and the last 4 closes - oldest first
+        run_b = state[j, 0]
+        run_s = state[j, 1]
+        a_b = state[j, 2]
+        a_s = state[j, 3]
+        b_b = state[j, 4]
+        b_s = state[j, 5]
+        hist = state[j, 6:]
+        for i in range(close.shape[1]):
+            cond_b = close[j, i] > hist[0]
+            cond_s = close[j, i] < hist[0]
+            if volume[j, i] > 0:
+                run_b = 0 if cond_b else run_b + 1
+                run_s = 0 if cond_s else run_s + 1
+                flag_b = run_b % 10 == 0
+                flag_s = run_s % 10 == 0
+            else:
+                # Candles without volume do not take part in the streak
+                flag_b = False
+                flag_s = False
+            a_b = 0 if flag_b else a_b + 1
+            a_s = 0 if flag_s else a_s + 1
+            b_b = b_b + 1 if flag_b else 0
+            b_s = b_s + 1 if flag_s else 0
+
+            count = a_s - a_b
+            if b_b > 9:
+                count = b_b % 9
+            if b_s > 9:
+                count = -(b_s % 9)
+            out[j, i] = count
+
+            hist[:3] = hist[1:]
+            hist[3] = close[j, i]
+        state[j, 0] = run_b
+        state[j, 1] = run_s
+        state[j, 2] = a_b
+        state[j, 3] = a_s
+        state[j, 4] = b_b
+        state[j, 5] = b_s
+    return out
+
+
+def td_state(rows: int = 1) -> np.ndarray:
+    """
+    Fresh TD Sequential counter state for `rows` series.
+    """
+    state = np.full((rows, TD_STATE_SIZE), np.nan)
+    # Streaks start at the first candle with volume, setup counters at the first candle
+    state[:, :6] = -1
+    return state
+
+
+@njit(cache=True)
+def wma(x, periods, offsets):
+    """
+    Linearly weighted moving average, for one or more series.
+
+    The value k candles back in the window gets the weight period - k + offset,
+    so offset 0 is the classic WMA (weights period .. 1).
+    Runs in O(n) with running weighted and plain sums. They are recomputed from the window
+    once every `period` candles, so rounding errors do not add up over long series.
+    Windows containing NaN are NaN.
+
+    :param x: 2D float64 array of values, one row per WMA line
+    :param periods: 1D int array of window lengths, one per row of x
+    :param offsets: 1D float64 array of weight offsets, one per row of x
+    :return: 2D float64 array of the same shape as x
+    """
+    out = np.full(x.shape, np.nan)
+    for j in range(x.shape[0]):
+        period = periods[j]
+        offset = offsets[j]
+        if period < 1:
+            continue
+        norm = period * (period + 1) / 2 + offset * period
+        valid = 0
+        since_seed = period
+        weighted = 0.0
+        total = 0.0
+        for i in range(x.shape[1]):
+            value = x[j, i]
+            if np.isnan(value):
+                valid = 0
+                continue
+            valid += 1
+            if valid < period:
+                continue
+            if valid == period or since_seed >= period:
+                weighted = 0.0
+                total = 0.0
+                for k in range(period):
+                    weighted += (period - k + offset) * x[j, i - k]
+                    total += x[j, i - k]
+                since_seed = 1
+            else:
+                leaving = x[j, i - period]
+                weighted += (period + offset) * value - total - offset * leaving
+                total += value - leaving
+                since_seed += 1
+            out[j, i] = weighted / norm
+    return out
+
+
+@njit(cache=True)
+def _moments(x, windows):
+    """
+    Rolling mean and sum of squared deviations (Welford) backing rolling_moments.
+    """
+    mean = np.full(x.shape, np.nan)
+    m2 = np.full(x.shape, np.nan)
+    for j in range(x.shape[0]):
+        window = windows[j]
+        valid = 0
+        since_seed = window
+        same = 0
+        # Shifted data - the sums are kept relative to the value at the last recompute
+        shift = 0.0
+        avg = 0.0
+        sq = 0.0
+        for i in range(x.shape[1]):
+            value = x[j, i]
+            if np.isnan(value):
+                valid = 0
+                continue
+            valid += 1
+            same = same + 1 if valid > 1 and value == x[j, i - 1] else 1
+            if valid < window:
+                continue
+            if same >= window:
+                # Flat window - exact, sliding updates would leave rounding noise in the std
+                shift = value
+                avg = 0.0
+                sq = 0.0
+                since_seed = window
+            else:
+                exact = valid == window or since_seed >= window
+                if not exact:
+                    new = value - shift
+                    leaving = x[j, i - window] - shift
+                    prev_avg = avg
+                    prev_sq = sq
+                    avg += (new - leaving) / window
+                    sq += (new - leaving) * (new - avg + leaving - prev_avg)
+                    since_seed += 1
+                    # The update cancels out when the variance collapses - recompute instead
+                    exact = sq < 1e-4 * prev_sq
+                if exact:
+                    # Two pass over the window - also resets the accumulated rounding errors
+                    shift = value
+                    avg = 0.0
+                    for k in range(window):
+                        avg += x[j, i - k] - shift
+                    avg /= window
+                    sq = 0.0
+                    for k in range(window):
+                        sq += (x[j, i - k] - shift - avg) ** 2
+                    since_seed = 1
+            mean[j, i] = avg + shift
+            m2[j, i] = max(sq, 0.0)
+    return mean, m2
+
+
+def _pandas_rolling(rows, window: int, method: str, **kwargs) -> np.ndarray:
+    """
+    pandas rolling window over each row of a 2D array - used when the kernels are not compiled.
+    """
+    import pandas as pd
+
+    rolling = pd.DataFrame(rows.T).rolling(window)
+    return getattr(rolling, method)(**kwargs).to_numpy(dtype=np.float64).T
+
+
+def rolling_moments(x, window, ddof: int = 1) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Rolling mean and standard deviation in O(n), for one or more series / windows.
+
+    Uses Welford's update when the window slides, and recomputes the window exactly once
+    every `window` candles so the rounding errors stay bounded.
+    Windows containing NaN are NaN. Without numba, pandas' rolling mean / std are used.
+
+    :param x: 1D array, or 2D array with one series per row
+    :param window: window length - or a list of window lengths, one per row of x.
+        A list of windows with a 1D x computes x once per window.
+    :param ddof: delta degrees of freedom of the standard deviation
+    :return: Tuple of float64 arrays (mean, std) - one row per window if a list of windows
+        and a 1D x are passed, otherwise of the same shape as x
+    """
+    x = np.asarray(x, dtype=np.float64)
+    windows = np.atleast_1d(np.asarray(window, dtype=np.int64))
+    rows = np.atleast_2d(x)
+    if x.ndim == 1 and len(windows) > 1:
+        rows = np.repeat(rows, len(windows), axis=0)
+    windows = np.broadcast_to(windows, (len(rows),)).copy()
+
+    if JIT_ENABLED:
+        mean, m2 = _moments(np.ascontiguousarray(rows), windows)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = np.sqrt(m2 / (windows - ddof)[:, None])
+    else:
+        mean = np.empty(rows.shape)
+        std = np.empty(rows.shape)
+        for w in np.unique(windows):
+            same = windows == w
+            mean[same] = _pandas_rolling(rows[same], int(w), "mean")
+            std[same] = _pandas_rolling(rows[same], int(w), "std", ddof=ddof)
+    if x.ndim == 1 and np.ndim(window) == 0:
+        return mean[0], std[0]
+    return mean, std
+
+
+@njit(cache=True)
+def _rolling_max(x, windows):
+    """
+    Rolling maximum over several windows in one pass (monotonic deques), backing
+    rolling_max / rolling_min.
+    """
+    n = x.shape[1]
+    out = np.full((x.shape[0], windows.shape[0], n), np.nan)
+    # One deque of candle indexes per window - values decreasing from head to tail
+    deque = np.empty((windows.shape[0], n), dtype=np.int64)
+    for j in range(x.shape[0]):
+        head = np.zeros(windows.shape[0], dtype=np.int64)
+        tail = np.zeros(windows.shape[0], dtype=np.int64)
+        last_nan = -1
+        for i in range(n):
+            value = x[j, i]
+            if np.isnan(value):
+                last_nan = i
+                continue
+            for k in range(windows.shape[0]):
+                window = windows[k]
+                while tail[k] > head[k] and x[j, deque[k, tail[k] - 1]] <= value:
+                    tail[k] -= 1
+                deque[k, tail[k]] = i
+                tail[k] += 1
+                while deque[k, head[k]] <= i - window:
+                    head[k] += 1
+                if i - last_nan >= window:
+                    out[j, k, i] = x[j, deque[k, head[k]]]
+    return out
+
+
+def _extrema(x, window, sign: float) -> np.ndarray:
+    x = np.asarray(x, dtype=np.float64)
+    windows = np.atleast_1d(np.asarray(window, dtype=np.int64))
+    if (windows < 0).any():
+        raise ValueError("window must be an integer 0 or greater")
+    if JIT_ENABLED:
+        rows = np.ascontiguousarray(np.atleast_2d(sign * x))
+        result = sign * _rolling_max(rows, np.maximum(windows, 1))
+        # Empty windows are NaN, like pandas
+        result[:, windows == 0] = np.nan
+    else:
+        method = "max" if sign > 0 else "min"
+        result = np.stack(
+            [_pandas_rolling(np.atleast_2d(x), int(w), method) for w in windows], axis=1
+        )
+    if np.ndim(window) == 0:
+        result = result[:, 0]
+    return result[0] if x.ndim == 1 else result
+
+
+def rolling_max(x, window) -> np.ndarray:
+    """
+    Rolling maximum in O(n) per window, for one or more series / windows at once.
+    Windows containing NaN are NaN, like pandas' rolling(window).max() - which is used
+    without numba.
+
+    :param x: 1D array, or 2D array with one series per row
+    :param window: window length - or a list of window lengths, computed in the same pass.
+        A window of 0 is all NaN, negative windows raise a ValueError.
+    :return: float64 array - shape (len(x),) for a 1D x and a single window,
+        with an extra axis for the windows (ahead of the candles) if a list is passed,
+        and a leading series axis for a 2D x
+    """
+    return _extrema(x, window, 1.0)
+
+
+def rolling_min(x, window) -> np.ndarray:
+    """
+    Rolling minimum in O(n) per window, for one or more series / windows at once.
+    See rolling_max.
+    """
+    return _extrema(x, window, -1.0)
+
+
+@njit(cache=True)
+def rolling_argmax(x, window):
+    """
+    Index of the rolling maximum (monotonic deque), for one or more series.
+    Ties resolve to the most recent candle.
+
+    :param x: 2D float64 array, one series per row
+    :param window: window length
+    :return: 2D int64 array of the same shape as x - -1 where the window is incomplete
+        or contains NaN
+    """
+    n = x.shape[1]
+    out = np.full(x.shape, -1, dtype=np.int64)
+    deque = np.empty(n, dtype=np.int64)
+    for j in range(x.shape[0]):
+        head = 0
+        tail = 0
+        last_nan = -1
+        for i in range(n):
+            value = x[j, i]
+            if np.isnan(value):
+                last_nan = i
+                continue
+            while tail > head and x[j, deque[tail - 1]] <= value:
+                tail -= 1
+            deque[tail] = i
+            tail += 1
+            while deque[head] <= i - window:
+                head += 1
+            if i - last_nan >= window:
+                out[j, i] = deque[head]
+    return out
+
+
+@njit(cache=True)
+def _chop_ratio(high, low, close, periods, start):
+    """
+    Choppiness ratio sum(TR, period) / (max(high, period) - min(low, period)) backing
+    chopiness - true range, its rolling sum and the rolling high / low range in a single pass.
+
+    :param high: 1D float64 array of highs
+    :param low: 1D float64 array of lows
+    :param close: 1D float64 array of closes
+    :param periods: 1D int array of periods
+    :param start: first candle whose true range is used - windows reaching
+        further back are NaN. The first candle's true range is high - low.
+    :return: 2D float64 array of shape (len(periods), len(high))
+    """
+    n = high.shape[0]
+    n_periods = periods.shape[0]
+    out = np.full((n_periods, n), np.nan)
+    tr = np.empty(n)
+    tr_sum = np.zeros(n_periods)
+    since_seed = periods.copy()
+    # Monotonic deques of candle indexes for the rolling high / low, one per period
+    highs = np.empty((n_periods, n), dtype=np.int64)
+    lows = np.empty((n_periods, n), dtype=np.int64)
+    high_head = np.zeros(n_periods, dtype=np.int64)
+    high_tail = np.zeros(n_periods, dtype=np.int64)
+    low_head = np.zeros(n_periods, dtype=np.int64)
+    low_tail = np.zeros(n_periods, dtype=np.int64)
+    last_nan = start - 1
+    for i in range(n):
+        tr[i] = high[i] - low[i]
+        if i > 0:
+            # NaN values are skipped, like DataFrame.max()
+            tr[i] = np.fmax(tr[i], abs(high[i] - close[i - 1]))
+            tr[i] = np.fmax(tr[i], abs(low[i] - close[i - 1]))
+        if np.isnan(tr[i]) or np.isnan(high[i]) or np.isnan(low[i]):
+            last_nan = i
+            continue
+        for k in range(n_periods):
+            period = periods[k]
+            while high_tail[k] > high_head[k] and high[highs[k, high_tail[k] - 1]] <= high[i]:
+                high_tail[k] -= 1
+            highs[k, high_tail[k]] = i
+            high_tail[k] += 1
+            while highs[k, high_head[k]] <= i - period:
+                high_head[k] += 1
+            while low_tail[k] > low_head[k] and low[lows[k, low_tail[k] - 1]] >= low[i]:
+                low_tail[k] -= 1
+            lows[k, low_tail[k]] = i
+            low_tail[k] += 1
+            while lows[k, low_head[k]] <= i - period:
+                low_head[k] += 1
+
+            if i - last_nan < period:
+                continue
+            if i - last_nan == period or since_seed[k] >= period:
+                # Exact sum once per period, so rounding errors do not add up
+                tr_sum[k] = 0.0
+                for m in range(i - period + 1, i + 1):
+                    tr_sum[k] += tr[m]
+                since_seed[k] = 1
+            else:
+                tr_sum[k] += tr[i] - tr[i - period]
+                since_seed[k] += 1
+            high_low = high[highs[k, high_head[k]]] - low[lows[k, low_head[k]]]
+            if high_low > 0:
+                out[k, i] = tr_sum[k] / high_low
+            elif tr_sum[k] > 0:
+                out[k, i] = np.inf
+    return out
+
+
+def chopiness(high, low, close, period, start: int = 0) -> np.ndarray:
+    """
+    Choppiness index, for one or more periods:
+
+        CI = 100 * log10(sum(TR, period) / (max(high, period) - min(low, period))) / log10(period)
+
+    :param high: 1D array of highs
+    :param low: 1D array of lows
+    :param close: 1D array of closes
+    :param period: period - or a list of periods. A period of 0 is all NaN,
+        negative periods raise a ValueError.
+    :param start: first candle whose true range is used - windows reaching
+        further back are NaN. The first candle's true range is high - low.
+    :return: float64 array - one row per period if a list of periods is passed
+    """
+    periods = np.atleast_1d(np.asarray(period, dtype=np.int64))
+    if (periods < 0).any():
+        raise ValueError("period must be an integer 0 or greater")
+    ratio = _chop_ratio(
+        np.asarray(high, dtype=np.float64),
+        np.asarray(low, dtype=np.float64),
+        np.asarray(close, dtype=np.float64),
+        np.maximum(periods, 1),
+        start,
+    )
+    # Empty windows are NaN, like pandas
+    ratio[periods == 0] = np.nan
+    with np.errstate(invalid="ignore", divide="ignore"):
+        result = 100 * np.log10(ratio) / np.log10(periods)[:, None]
+    return result[0] if np.ndim(period) == 0 else result
+
+
+@njit(cache=True)
+def _sma_ema(x, periods, ema):
+    """
+    TA-Lib compatible SMA (running sum) / EMA (SMA seed) recursions backing _ma_bank,
+    all periods in a single pass over x. Leading NaNs are skipped, later NaNs propagate
+    like in TA-Lib.
+    """
+    n = x.shape[0]
+    n_periods = periods.shape[0]
+    out = np.full((n_periods, n), np.nan)
+    first = 0
+    while first < n and np.isnan(x[first]):
+        first += 1
+    totals = np.zeros(n_periods)
+    values = np.zeros(n_periods)
+    for i in range(first, n):
+        for j in range(n_periods):
+            period = periods[j]
+            seed = first + period - 1
+            if i < seed:
+                totals[j] += x[i]
+            elif ema:
+                if i == seed:
+                    values[j] = (totals[j] + x[i]) / period
+                else:
+                    values[j] = ((x[i] - values[j]) * (2.0 / (period + 1))) + values[j]
+                out[j, i] = values[j]
+            else:
+                totals[j] += x[i]
+                out[j, i] = totals[j] / period
+                totals[j] -= x[i - period + 1]
+    return out
+
+
+def _ma_bank(series, periods, kind: str = "ema") -> np.ndarray:
+    """
+    Moving averages of one series for several periods, backing indicators.ma_bank.
+
+    "sma" and "ema" match TA-Lib's SMA / EMA and compute all periods in a single pass.
+    "wma" and "rma" (Wilder's smoothing, see wilder_smooth) run one pass per period.
+    Leading NaNs are skipped. "wma" matches TA-Lib's WMA only without NaNs after the
+    first value - it restarts after a NaN, where TA-Lib stays NaN.
+
+    :param series: 1D array (or Series) of values
+    :param periods: list of periods
+    :param kind: "ema", "sma", "wma" or "rma"
+    :return: float64 array of shape (len(periods), len(series))
+    """
+    x = np.ascontiguousarray(series, dtype=np.float64)
+    periods = np.atleast_1d(np.asarray(periods, dtype=np.int64))
+    if (periods < 1).any():
+        raise ValueError("Moving average periods must be 1 or greater")
+    kind = kind.lower()
+
+    if kind in ("sma", "ema"):
+        return _sma_ema(x, periods, kind == "ema")
+    if kind == "rma":
+        return wilder_smooth(x, periods.tolist()).reshape(len(periods), -1)
+    if kind == "wma":
+        # Leading NaNs are skipped - the first window starts at the first value
+        rows = np.repeat(x.reshape(1, -1), len(periods), axis=0)
+        return wma(rows, periods, np.zeros(len(periods)))
+    raise ValueError(f"Unknown moving average kind {kind}, use ema, sma, wma or rma")
+
+
+@njit(cache=True)
+def _schaff(macd, lengths):
+    """
+    Stochastic of the MACD (%K) and its rolling mean (%D) backing schaff_trend_cycle -
+    rolling high / low and the %K sum in a single pass, one row of macd per length.
+    Windows containing NaN are NaN, windows of identical %K values average to that value.
+    """
+    rows, n = macd.shape
+    k = np.full((rows, n), np.nan)
+    d = np.full((rows, n), np.nan)
+    # Monotonic deques of candle indexes for the rolling high / low
+    highs = np.empty(n, dtype=np.int64)
+    lows = np.empty(n, dtype=np.int64)
+    for j in range(rows):
+        length = lengths[j]
+        x = macd[j]
+        high_head = high_tail = low_head = low_tail = 0
+        last_nan = -1
+        last_k_nan = -1
+        k_sum = 0.0
+        since_seed = length
+        same_run = 0
+        for i in range(n):
+            if np.isnan(x[i]):
+                last_nan = i
+                last_k_nan = i
+                continue
+            while high_tail > high_head and x[highs[high_tail - 1]] <= x[i]:
+                high_tail -= 1
+            highs[high_tail] = i
+            high_tail += 1
+            while highs[high_head] <= i - length:
+                high_head += 1
+            while low_tail > low_head and x[lows[low_tail - 1]] >= x[i]:
+                low_tail -= 1
+            lows[low_tail] = i
+            low_tail += 1
+            while lows[low_head] <= i - length:
+                low_head += 1
+
+            if i - last_nan < length:
+                last_k_nan = i
+                continue
+            low_value = x[lows[low_head]]
+            high_low = x[highs[high_head]] - low_value
+            if high_low == 0:
+                # Flat window - 0 / 0
+                last_k_nan = i
+                continue
+            k[j, i] = ((x[i] - low_value) / high_low) * 100
+            if i - last_k_nan > 1 and k[j, i] == k[j, i - 1]:
+                same_run += 1
+            else:
+                same_run = 1
+
+            if i - last_k_nan < length:
+                continue
+            if i - last_k_nan == length or since_seed >= length:
+                # Exact sum once per length, so rounding errors do not add up
+                k_sum = 0.0
+                for m in range(i - length + 1, i + 1):
+                    k_sum += k[j, m]
+                since_seed = 1
+            else:
+                k_sum += k[j, i] - k[j, i - length]
+                since_seed += 1
+            d[j, i] = k[j, i] if same_run >= length else k_sum / length
+    return k, d
+
+
+def schaff_trend_cycle(close, params) -> np.ndarray:
+    """
+    Schaff Trend Cycle for a list of (fast, slow, length) triples. Each EMA period is
+    computed once, and the stochastic of every MACD line runs through a single pass.
+
+    :param close: 1D array of closes
+    :param params: list of (fast, slow, length) triples - EMA periods must be 1 or
+        greater, a length of 0 is all NaN
+    :return: 2D float64 array of shape (len(params), len(close))
+    """
+    close = np.asarray(close, dtype=np.float64)
+    params = np.asarray(params, dtype=np.int64).reshape(-1, 3)
+    lengths = params[:, 2]
+    if (lengths < 0).any():
+        raise ValueError("length must be an integer 0 or greater")
+    periods = np.unique(params[:, :2])
+    emas = _ma_bank(close, periods, kind="ema")
+    fast = emas[np.searchsorted(periods, params[:, 0])]
+    slow = emas[np.searchsorted(periods, params[:, 1])]
+    macd = fast - slow
+
+    stok, stod = _schaff(macd, np.maximum(lengths, 1))
+    # Empty windows are NaN, like pandas
+    stok[lengths == 0] = np.nan
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return 100 * (macd - (stok * macd)) / ((stod * macd) - (stok * macd))
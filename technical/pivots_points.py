@@ -1,11 +1,138 @@
-import freqtrade.vendor.qtpylib.indicators as qtpylib
+import numpy as np
 import pandas as pd
 
+from technical import qtpylib
+
 """
 Indicators for Freqtrade
 author@: Gerald Lonlas
 """
 
+PIVOT_METHODS = ("standard", "fibonacci", "camarilla", "woodie")
+
+
+def _pivot_coefficients(method: str, levels: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Describes every level of a pivot method as anchor +/- coefficient * (high - low).
+
+    :return: Tuple of (anchors, coefficients), one entry per level.
+        Anchors: 0 = pivot, 1 = 2 x pivot - low (resistance) / 2 x pivot - high (support),
+        2 = close.
+    """
+    if levels < 0:
+        raise ValueError("Pivot levels must be 0 or greater")
+    steps = np.arange(1, levels + 1)
+    if method == "standard":
+        # Level 1 from the pivot, then (Pivot - Support #n) + Resistance #n - doubling the range
+        anchors = np.where(steps == 1, 1, 0)
+        coefficients = np.where(steps == 1, 0.0, 2.0 ** (steps - 2))
+    elif method == "fibonacci":
+        # 0.382, 0.618, 1.0, then each ratio is the sum of the previous two
+        coefficients = np.empty(levels)
+        coefficients[:3] = [0.382, 0.618, 1.0][:levels]
+        for i in range(3, levels):
+            coefficients[i] = coefficients[i - 1] + coefficients[i - 2]
+        anchors = np.zeros(levels, dtype=np.int64)
+    elif method == "camarilla":
+        if levels > 4:
+            raise ValueError("Camarilla pivots are only defined for up to 4 levels")
+        anchors = np.full(levels, 2)
+        coefficients = 1.1 / np.array([12.0, 6.0, 4.0, 2.0])[:levels]
+    elif method == "woodie":
+        # Level 2 from the pivot, levels 3+ continue from level 1 in steps of the range
+        anchors = np.where(steps == 2, 0, 1)
+        coefficients = np.where(steps == 2, 1.0, np.maximum(steps - 2, 0).astype(np.float64))
+    else:
+        raise ValueError(f"Pivot method {method} not supported, use one of {PIVOT_METHODS}")
+    return anchors, coefficients
+
+
+def pivot_levels(
+    high, low, close, levels: int = 3, method: str = "standard", pivot=None
+) -> np.ndarray:
+    """
+    Pivot, resistance and support levels for the given high / low / close values,
+    all levels in one broadcasted step.
+
+    Pivot = (High + Low + Close) / 3 - Woodie: (High + Low + 2 x Close) / 4
+    Standard:  R1 = 2 x Pivot - Low, S1 = 2 x Pivot - High,
+               Rn = (Pivot - Sn-1) + Rn-1, Sn = Pivot - (Rn-1 - Sn-1)
+    Fibonacci: Rn / Sn = Pivot +/- (0.382, 0.618, 1.0, 1.618, ...) x (High - Low)
+    Camarilla: Rn / Sn = Close +/- 1.1 / (12, 6, 4, 2) x (High - Low) - up to 4 levels
+    Woodie:    R1 / S1 as Standard, R2 / S2 = Pivot +/- (High - Low),
+               Rn = R1 + (n - 2) x (High - Low), Sn = S1 - (n - 2) x (High - Low)
+
+    :param high: array of highs
+    :param low: array of lows
+    :param close: array of closes - may be None with a precomputed pivot, unless the
+        method is camarilla
+    :param levels: Num of support/resistance desired - 0 returns the pivot only
+    :param method: "standard", "fibonacci", "camarilla" or "woodie"
+    :param pivot: precomputed pivot values - replaces the pivot formula
+    :return: 2D array of shape (2 * levels + 1, len(close)) - rows
+        pivot, r1, s1, r2, s2, ...
+    """
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    anchors, coefficients = _pivot_coefficients(method, levels)
+    if close is None and (pivot is None or (anchors == 2).any()):
+        raise ValueError(f"close is required for {method} pivots")
+    if close is not None:
+        close = np.asarray(close, dtype=np.float64)
+
+    if pivot is not None:
+        pivot = np.asarray(pivot, dtype=np.float64)
+    elif method == "woodie":
+        pivot = (high + low + 2 * close) / 4
+    else:
+        pivot = (high + low + close) / 3
+    resistance_anchors = [pivot, 2 * pivot - low, close]
+    support_anchors = [pivot, 2 * pivot - high, close]
+    spread = coefficients[:, None] * (high - low)
+
+    result = np.empty((2 * levels + 1, len(pivot)))
+    result[0] = pivot
+    if not levels:
+        return result
+    result[1::2] = np.stack([resistance_anchors[anchor] for anchor in anchors]) + spread
+    result[2::2] = np.stack([support_anchors[anchor] for anchor in anchors]) - spread
+    return result
+
+
+def pivots(
+    dataframe: pd.DataFrame, timeperiod=30, levels=3, method="standard", period=None
+) -> np.ndarray:
+    """
+    Pivot points from rolling windows, or from session / resampled periods.
+
+    :param dataframe: Dataframe containing OHLCV data
+    :param timeperiod: rolling window (in candles) of the high / low - the close is the
+        candle's own close
+    :param levels: Num of support/resistance desired
+    :param method: "standard", "fibonacci", "camarilla" or "woodie" (see pivot_levels)
+    :param period: pandas offset alias (e.g. "1D", "1W") - if set, the levels of each candle
+        come from the high / low / close of the previous period (using the `date` column),
+        and timeperiod is ignored
+    :return: 2D array of shape (2 * levels + 1, len(dataframe)) - rows pivot, r1, s1, r2, s2, ...
+    """
+    if period is None:
+        from technical.kernels import rolling_max, rolling_min
+
+        high = rolling_max(dataframe["high"], timeperiod)
+        low = rolling_min(dataframe["low"], timeperiod)
+        close = dataframe["close"].to_numpy(dtype=np.float64)
+    else:
+        periods = (
+            dataframe.resample(period, on="date", label="left", closed="left")
+            .agg({"high": "max", "low": "min", "close": "last"})
+            .dropna()
+        )
+        # Period each candle belongs to - levels are taken from the one before
+        idx = periods.index.searchsorted(dataframe["date"], side="right") - 1
+        previous = periods.shift(1).to_numpy(dtype=np.float64)[idx]
+        high, low, close = previous.T
+    return pivot_levels(high, low, close, levels, method)
+
 
 def pivots_points(dataframe: pd.DataFrame, timeperiod=30, levels=3) -> pd.DataFrame:
     """
@@ -26,40 +153,21 @@ def pivots_points(dataframe: pd.DataFrame, timeperiod=30, levels=3) -> pd.DataFr
     Support #3 = Pivot - (Resistance #2 - Support #2)
     ...
 
+    Previous values are averaged over the last `timeperiod` candles.
+    See `pivots` for the other pivot methods and session based pivots.
+
     :param dataframe:
     :param timeperiod: Period to compare (in ticker)
     :param levels: Num of support/resistance desired
     :return: dataframe
     """
+    low = qtpylib.rolling_mean(dataframe["low"], window=timeperiod)
+    high = qtpylib.rolling_mean(dataframe["high"], window=timeperiod)
+    pivot = qtpylib.rolling_mean(qtpylib.typical_price(dataframe), window=timeperiod)
 
-    data = {}
-
-    low = qtpylib.rolling_mean(
-        series=pd.Series(index=dataframe.index, data=dataframe["low"]), window=timeperiod
-    )
-
-    high = qtpylib.rolling_mean(
-        series=pd.Series(index=dataframe.index, data=dataframe["high"]), window=timeperiod
-    )
-
-    # Pivot
-    data["pivot"] = qtpylib.rolling_mean(series=qtpylib.typical_price(dataframe), window=timeperiod)
-
-    # Resistance #1
-    data["r1"] = (2 * data["pivot"]) - low
-
-    # Resistance #2
-    data["s1"] = (2 * data["pivot"]) - high
-
-    # Calculate Resistances and Supports >1
-    for i in range(2, levels + 1):
-        prev_support = data["s" + str(i - 1)]
-        prev_resistance = data["r" + str(i - 1)]
-
-        # Resistance
-        data["r" + str(i)] = (data["pivot"] - prev_support) + prev_resistance
-
-        # Support
-        data["s" + str(i)] = data["pivot"] - (prev_resistance - prev_support)
+    result = pivot_levels(high, low, None, levels, pivot=pivot)
 
-    return pd.DataFrame(index=dataframe.index, data=data)
+    columns = ["pivot"]
+    for i in range(1, levels + 1):
+        columns += [f"r{i}", f"s{i}"]
+    return pd.DataFrame(result.T, index=dataframe.index, columns=columns)
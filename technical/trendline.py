@@ -8,6 +8,8 @@ https://github.com/dysonance/Trendy
 def gentrends(dataframe, field="close", window=1 / 3.0, charts=False):
     """
     Returns a Pandas dataframe with support and resistance lines.
+    The lines are fitted over the whole data, so they look into the future -
+    use rolling_trendlines() for backtesting.
 
     :param dataframe: incoming data matrix
     :param field: for which column would you like to generate the trendline
@@ -80,6 +82,8 @@ def segtrends(dataframe, field="close", segments=2, charts=False):
     """
     Turn minitrends to iterative process more easily adaptable to
     implementation in simple trading systems; allows backtesting functionality.
+    The segments span the whole data, so the lines look into the future -
+    use rolling_trendlines() for backtesting.
 
     :param dataframe: incoming data matrix
     :param field: for which column would you like to generate the trendline
@@ -143,3 +147,52 @@ def segtrends(dataframe, field="close", segments=2, charts=False):
         trends, index=np.arange(0, len(x)), columns=["Data", "Max Line", "Min Line"]
     )
     return trends
+
+
+def rolling_trendlines(dataframe, field="close", window=60):
+    """
+    Causal support and resistance lines, recomputed for every candle from the trailing
+    `window` candles only.
+
+    The trailing window is split in two halves (like segtrends with 2 segments).
+    The max line runs through the highest value of each half, the min line through
+    the lowest, and both are evaluated at the current candle.
+    Extrema are tracked incrementally, so this runs in linear time.
+
+    :param dataframe: incoming data matrix
+    :param field: column to generate the trendlines for - or a list of columns
+    :param window: trailing window length in candles (two halves of window // 2), at least 2
+    :return: dataframe with "Data", "Max Line" and "Min Line" columns on the dataframe index.
+        For a list of columns, a float64 array of shape (columns, 2, candles)
+        holding the max line and the min line of each column.
+    """
+    import numpy as np
+    import pandas as pd
+
+    from technical.kernels import rolling_argmax
+
+    if window < 2:
+        raise ValueError(f"window must be at least 2 to split it in two halves, got {window}")
+
+    fields = [field] if isinstance(field, str) else list(field)
+    x = np.ascontiguousarray(dataframe[fields].to_numpy(dtype=np.float64).T)
+    segment = window // 2
+    candles = np.arange(x.shape[1])
+
+    lines = np.full((len(fields), 2, x.shape[1]), np.nan)
+    for side, values in enumerate((x, -x)):
+        recent = rolling_argmax(values, segment)
+        older = np.full(recent.shape, -1)
+        older[:, segment:] = recent[:, :-segment]
+        valid = (recent >= 0) & (older >= 0)
+
+        rows = np.nonzero(valid)[0]
+        i1, i2 = older[valid], recent[valid]
+        slope = (x[rows, i2] - x[rows, i1]) / (i2 - i1)
+        lines[:, side][valid] = x[rows, i2] + slope * (candles[np.nonzero(valid)[1]] - i2)
+
+    if not isinstance(field, str):
+        return lines
+    return pd.DataFrame(
+        {"Data": x[0], "Max Line": lines[0, 0], "Min Line": lines[0, 1]}, index=dataframe.index
+    )
@@ -0,0 +1,45 @@
+# pragma pylint: disable=missing-docstring
+
+import numpy as np
+from pandas import DataFrame
+
+from technical.bouncyhouse import bounce, touches
+
+
+def test_touches_bounce():
+    candles = DataFrame(
+        {
+            "open": [9.0, 10.5, 10.2, 9.8, 9.5],
+            "high": [11.0, 11.0, 10.8, 10.6, 9.9],
+            "low": [8.5, 9.5, 10.1, 9.4, 9.0],
+            "close": [10.5, 10.3, 10.6, 9.6, 9.7],
+        }
+    )
+
+    assert touches(candles, 10).tolist() == [1, -1, 0, -1, 0]
+    # Bounces only follow a touch closing above the level
+    assert bounce(candles, 10).tolist() == [0, 1, 0, 0, 0]
+    assert touches(candles, 10.55).tolist() == [1, -1, 1, -1, 0]
+    assert bounce(candles, 10.55).tolist() == [0, -1, 0, -1, 0]
+
+    levels = [9.7, 10, 10.55, 12]
+    touch = touches(candles, np.array(levels))
+    bounces = bounce(candles, levels)
+    assert touch.dtype == bounces.dtype == np.int8
+    assert touch.shape == bounces.shape == (4, 5)
+    for row, level in enumerate(levels):
+        assert np.array_equal(touch[row], touches(candles, level))
+        assert np.array_equal(bounces[row], bounce(candles, level))
+    assert not touch[3].any()
+
+
+def test_bounce_below(testdata_1m_btc):
+    level = testdata_1m_btc["close"].median()
+    touch = touches(testdata_1m_btc, level)
+    result = bounce(testdata_1m_btc, level)
+
+    after_touch = np.roll(touch == 1, 1)
+    after_touch[0] = False
+    assert (result[~after_touch] == 0).all()
+    below = testdata_1m_btc[["open", "close"]].max(axis=1).to_numpy() < level
+    assert ((result == -1) == (after_touch & below)).all()
@@ -0,0 +1,43 @@
+# pragma pylint: disable=missing-docstring
+
+import numpy as np
+
+from technical.candles import heikinashi
+
+
+def test_heikinashi(testdata_1m_btc):
+    bars = testdata_1m_btc.iloc[100:600]
+
+    result = heikinashi(bars)
+
+    assert result.index.equals(bars.index)
+
+    ha_close = (bars["open"] + bars["high"] + bars["low"] + bars["close"]).to_numpy() / 4
+    ha_open = [(bars["open"].iloc[0] + bars["close"].iloc[0]) / 2]
+    for i in range(len(bars) - 1):
+        ha_open.append((ha_open[i] + ha_close[i]) / 2)
+
+    assert np.array_equal(result["close"], ha_close)
+    assert np.array_equal(result["open"], ha_open)
+    assert (result["high"] >= result[["open", "close"]].max(axis=1)).all()
+    assert (result["low"] <= result[["open", "close"]].min(axis=1)).all()
+
+    candle = np.where(result["open"] < result["close"], 1, -1)
+    assert np.array_equal(result["candle"], candle)
+    assert result["reversal"].iloc[0] == 0
+    assert np.array_equal(
+        result["reversal"].iloc[1:], np.where(np.diff(candle) != 0, candle[1:], 0)
+    )
+    for column in ["flat_bottom", "flat_top", "small_body", "candle", "reversal"]:
+        assert result[column].dtype == np.int8
+    assert (result["lower_wick"] >= 0).all()
+    assert (result["upper_wick"] >= 0).all()
+
+
+def test_heikinashi_qtpylib(testdata_1m_btc):
+    from technical.qtpylib import heikinashi as qtpylib_heikinashi
+
+    result = qtpylib_heikinashi(testdata_1m_btc)
+
+    assert list(result.columns) == ["open", "high", "low", "close"]
+    assert result.equals(heikinashi(testdata_1m_btc)[["open", "high", "low", "close"]])
@@ -13,3 +13,34 @@ def test_went_up():
 def test_went_down():
     series = pd.Series([1, 2, 3, 1])
     assert went_down(series).equals(pd.Series([False, False, False, True]))
+
+
+def test_ehlers_super_smoother():
+    from math import cos, exp, pi, sqrt
+
+    import numpy as np
+
+    from technical.indicator_helpers import ehlers_super_smoother
+
+    series = pd.Series(np.sin(np.arange(100) / 5) + 10, index=range(5, 105), name="close")
+
+    magic = pi * sqrt(2) / 6
+    coeff2 = 2 * exp(-magic) * cos(magic)
+    coeff3 = -exp(-magic) * exp(-magic)
+    coeff1 = (1 - coeff2 - coeff3) / 2
+    expected = series.to_numpy().copy()
+    for i in range(2, len(series)):
+        expected[i] = (
+            coeff1 * (series.iloc[i] + series.iloc[i - 1])
+            + coeff2 * expected[i - 1]
+            + coeff3 * expected[i - 2]
+        )
+
+    result = ehlers_super_smoother(series)
+    assert result.index.equals(series.index)
+    assert result.name == "close"
+    assert np.allclose(result, expected, rtol=1e-12)
+
+    frame = ehlers_super_smoother(pd.DataFrame({"a": series, "b": series * 2}))
+    assert np.allclose(frame["a"], expected, rtol=1e-12)
+    assert np.allclose(frame["b"], expected * 2, rtol=1e-12)
@@ -1,4 +1,8 @@
+import warnings
+
 import numpy
+import pytest
+from pandas import DataFrame
 
 
 def test_atr(testdata_1m_btc):
@@ -78,6 +82,33 @@ def test_fibonacci_retracements(testdata_1m_btc):
     default = fibonacci_retracements(testdata_1m_btc)
     assert default.equals(fibonacci_retracements(testdata_1m_btc, window=120))
 
+    # Several windows at once, one row per window
+    windows = [60, 120, 0]
+    levels = fibonacci_retracements(testdata_1m_btc, window=windows)
+    assert levels.shape == (3, len(testdata_1m_btc))
+    for row, window in enumerate(windows):
+        single = fibonacci_retracements(testdata_1m_btc, window=window)
+        assert numpy.array_equal(levels[row], single, equal_nan=True)
+
+    # Raw position between the rolling low and high
+    close = testdata_1m_btc["close"]
+    position = fibonacci_retracements(testdata_1m_btc, window=60, position=True)
+    low = close.rolling(60).min()
+    assert numpy.allclose(position, (close - low) / (close.rolling(60).max() - low), equal_nan=True)
+    positions = fibonacci_retracements(testdata_1m_btc, window=windows, position=True)
+    assert numpy.array_equal(positions[0], position, equal_nan=True)
+    assert (levels[:, 119:] <= positions[:, 119:]).all()
+
+    # No data
+    empty = testdata_1m_btc.iloc[:0]
+    assert fibonacci_retracements(empty).empty
+    assert fibonacci_retracements(empty, window=windows).shape == (3, 0)
+    missing = testdata_1m_btc.iloc[:10].assign(close=numpy.nan)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert fibonacci_retracements(missing, window=[0, 5]).shape == (2, 10)
+        assert fibonacci_retracements(missing, window=0).isna().all()
+
 
 def test_return_on_investment():
     from pandas import DataFrame
@@ -104,6 +135,13 @@ def test_return_on_investment():
         assert (dataframe.loc[dataframe["buy"] == 1, "roi"] == 0).all()
         assert numpy.allclose(numpy.array(dataframe["roi"]), roi)
 
+    # All signal columns at once
+    dataframe = DataFrame({"close": close, "a": buys[0], "b": buys[1], "c": buys[2]})
+    result = return_on_investment(dataframe, decimals=2, signals=["a", "b", "c"])
+    assert result.shape == (3, 6)
+    assert numpy.allclose(result, rois)
+    assert "roi" not in dataframe.columns
+
 
 def test_rma():
     from pandas import DataFrame
@@ -123,6 +161,23 @@ def test_rma():
     assert result.isna().sum() == 4
 
 
+def test_rma_leading_nan():
+    from pandas import DataFrame
+
+    from technical.indicators import rma
+
+    close = numpy.array([numpy.nan, 6, -1, 5, 4, 12, 5, 11, 10, 3, 13], dtype=float)
+    dataframe = DataFrame({"close": close})
+
+    # The seed is the SMA of the first 5 valid values - one candle later than without the NaN
+    expected = [numpy.nan] * 5 + [5.2, 5.16, 6.328, 7.0624, 6.249920, 7.599936]
+
+    result = rma(dataframe, 5)
+
+    assert numpy.allclose(result, expected, equal_nan=True)
+    assert result.isna().sum() == 5
+
+
 def test_rma_short_dataframe():
     from pandas import DataFrame
 
@@ -131,3 +186,306 @@ def test_rma_short_dataframe():
     dataframe = DataFrame({"close": numpy.array([1.0, 2.0, 3.0])})
 
     assert rma(dataframe, 5).isna().all()
+
+
+def test_laguerre(testdata_1m_btc):
+    from technical.indicators import laguerre
+
+    result = laguerre(testdata_1m_btc)
+
+    assert result.index.equals(testdata_1m_btc.index)
+    assert result.min() >= 0
+    assert result.max() <= 1
+
+    # Multiple gammas are computed in one pass, one row per gamma
+    batch = laguerre(testdata_1m_btc, gamma=[0.5, 0.75])
+    assert batch.shape == (2, len(testdata_1m_btc))
+    assert numpy.array_equal(batch[1], result.to_numpy())
+    assert numpy.array_equal(batch[0], laguerre(testdata_1m_btc, gamma=0.5).to_numpy())
+
+    smoothed = laguerre(testdata_1m_btc, smooth=3)
+    assert smoothed.iloc[:2].isna().all()
+    assert smoothed.iloc[2:].notna().all()
+
+
+def test_vidya(testdata_1m_btc):
+    from technical.indicators import VIDYA
+
+    result = VIDYA(testdata_1m_btc)
+
+    assert result.index.equals(testdata_1m_btc.index)
+    # No value before the first full window
+    assert (result.iloc[:9] == 0).all()
+    assert (result.iloc[9:] > 0).all()
+
+    for select in (True, False):
+        batch = VIDYA(testdata_1m_btc, length=[9, 20], select=select)
+        assert batch.shape == (2, len(testdata_1m_btc))
+        assert numpy.array_equal(batch[0], VIDYA(testdata_1m_btc, 9, select).to_numpy())
+        assert numpy.array_equal(batch[1], VIDYA(testdata_1m_btc, 20, select).to_numpy())
+
+
+def test_mmar(testdata_1m_btc):
+    from technical.indicators import mmar
+
+    columns = list(testdata_1m_btc.columns)
+    codes = mmar(testdata_1m_btc, colors=False)
+    colors = mmar(testdata_1m_btc)
+
+    # No helper columns are left in the input dataframe
+    assert list(testdata_1m_btc.columns) == columns
+    assert len(codes) == 10
+    assert codes[0].name == "leadMA"
+    assert codes[-1].name == "ma90_c"
+
+    names = {2: "lime", 1: "green", 0: "grey", -1: "maroon", -2: "red"}
+    for code, color in zip(codes, colors):
+        assert code.dtype == numpy.int8
+        assert code.index.equals(testdata_1m_btc.index)
+        assert code.map(names).equals(color)
+    # Not enough data for the 100 period MA
+    assert (codes[0].iloc[:99] == 0).all()
+    assert set(codes[0].iloc[100:]) <= {2, 1, -1, -2}
+
+
+def test_madrid_sqz(testdata_1m_btc):
+    from technical.indicators import madrid_sqz
+
+    columns = list(testdata_1m_btc.columns)
+    cma, rma, sma = madrid_sqz(testdata_1m_btc, colors=False)
+    cma_c, rma_c, sma_c = madrid_sqz(testdata_1m_btc)
+
+    assert list(testdata_1m_btc.columns) == columns
+    assert cma.dtype == rma.dtype == sma.dtype == numpy.int8
+    assert rma.index.equals(testdata_1m_btc.index)
+    assert cma.map({1: "aqua", -1: "fuchsia"}).equals(cma_c)
+    assert rma.map({1: "green", 0: "yellow", -1: "maroon"}).equals(rma_c)
+    assert sma.map({1: "lime", -1: "red"}).equals(sma_c)
+    assert set(rma) == {1, 0, -1}
+
+
+def test_vfi(testdata_1m_btc):
+    from technical.indicators import vfi
+
+    columns = list(testdata_1m_btc.columns)
+    vfi_line, vfima, hist = vfi(testdata_1m_btc)
+
+    assert list(testdata_1m_btc.columns) == columns
+    assert vfi_line.index.equals(testdata_1m_btc.index)
+    assert (vfi_line.name, vfima.name, hist.name) == ("vfi", "vfima", "vfi_hist")
+    # length + 1 candles until the previous bar volume average is available
+    assert vfi_line.iloc[:131].isna().all()
+    assert numpy.allclose(hist, vfi_line - vfima, equal_nan=True)
+
+    smooth, _, _ = vfi(testdata_1m_btc, smoothVFI=True)
+    assert numpy.allclose(smooth, vfi_line.rolling(3).mean(), equal_nan=True)
+
+
+def test_td_sequential(testdata_1m_btc):
+    from technical.indicators import TDSequential, td_sequential
+
+    data = testdata_1m_btc.copy()
+    data.loc[data.index[::7], "volume"] = 0
+    result = td_sequential(data)["TD_count"]
+
+    assert result.dtype == numpy.int64
+    assert (result.iloc[:4] == 0).all()
+
+    # Streaming - warm up on history, then candle by candle
+    td = TDSequential()
+    counts = list(td.update(data["close"].iloc[:-50], data["volume"].iloc[:-50]))
+    for close, volume in zip(data["close"].iloc[-50:], data["volume"].iloc[-50:]):
+        counts.append(td.update(close, volume))
+    assert counts == result.tolist()
+
+    # Several pairs at once
+    td = TDSequential(2)
+    batch = td.update(
+        numpy.array([testdata_1m_btc["close"], data["close"]]),
+        numpy.array([testdata_1m_btc["volume"], data["volume"]]),
+    )
+    assert batch.shape == (2, len(data))
+    assert (batch[1] == result.to_numpy()).all()
+    assert td.update([1.0, 2.0], [1.0, 1.0]).shape == (2,)
+
+
+def test_osc(testdata_1m_btc):
+    from technical.indicators import osc
+
+    columns = list(testdata_1m_btc.columns)
+    result = osc(testdata_1m_btc, 14)
+
+    assert list(testdata_1m_btc.columns) == columns
+    assert result.index.equals(testdata_1m_btc.index)
+    dm = testdata_1m_btc["high"].diff().clip(lower=0).rolling(14).mean()
+    dmn = (-testdata_1m_btc["low"].diff()).clip(lower=0).rolling(14).mean()
+    assert numpy.allclose(result, dm / (dm + dmn), equal_nan=True)
+    assert result.iloc[:14].isna().all()
+
+    batch = osc(testdata_1m_btc, [5, 14])
+    assert batch.shape == (2, len(testdata_1m_btc))
+    assert numpy.array_equal(batch[1], result.to_numpy(), equal_nan=True)
+
+    # Flat candles - no moves at all
+    flat = testdata_1m_btc.iloc[:30].copy()
+    flat["high"] = 2.0
+    flat["low"] = 1.0
+    assert osc(flat, 14).isna().all()
+
+    # A missing high only affects the windows containing it
+    gap = testdata_1m_btc.copy()
+    gap.loc[gap.index[1000], "high"] = numpy.nan
+    gapped = osc(gap, 14)
+    assert gapped.iloc[1000:1015].isna().all()
+    assert numpy.array_equal(gapped.iloc[1015:], result.iloc[1015:])
+
+
+def test_tv_wma(testdata_1m_btc):
+    from technical.indicators import tv_hma, tv_wma
+
+    close = testdata_1m_btc["close"]
+    result = tv_wma(testdata_1m_btc, 9)
+
+    assert result.index.equals(testdata_1m_btc.index)
+    # Weights 8 .. 2 over the previous 7 candles
+    expected = sum(close.shift(i) * (9 - i) for i in range(1, 8)) / sum(range(2, 9))
+    assert numpy.allclose(result, expected, equal_nan=True, rtol=1e-12)
+    assert result.iloc[:7].isna().all()
+
+    hma = tv_hma(testdata_1m_btc, 16)
+    h = 2 * tv_wma(close, 8) - tv_wma(close, 16)
+    assert numpy.allclose(hma, tv_wma(h, 4), equal_nan=True)
+    assert hma.notna().sum() == len(close) - 16
+
+    empty = testdata_1m_btc.iloc[:0]
+    assert tv_wma(empty, 9).empty
+    assert tv_hma(empty, 16).empty
+
+
+def test_stc(testdata_1m_btc):
+    import talib
+
+    from technical.indicators import stc, stc_batch
+
+    close = testdata_1m_btc["close"]
+    columns = list(testdata_1m_btc.columns)
+    result = stc(testdata_1m_btc)
+
+    assert list(testdata_1m_btc.columns) == columns
+    assert result.name == "stc"
+    assert result.index.equals(testdata_1m_btc.index)
+
+    macd = talib.EMA(close, 23) - talib.EMA(close, 50)
+    low = macd.rolling(10).min()
+    stok = (macd - low) / (macd.rolling(10).max() - low) * 100
+    stod = stok.rolling(10).mean()
+    expected = 100 * (macd - (stok * macd)) / ((stod * macd) - (stok * macd))
+    finite = numpy.isfinite(expected)
+    assert numpy.array_equal(numpy.isnan(result), numpy.isnan(expected))
+    assert numpy.array_equal(numpy.isinf(result), numpy.isinf(expected))
+    assert numpy.allclose(result[finite], expected[finite], rtol=1e-10)
+
+    batch = stc_batch(testdata_1m_btc, [(23, 50, 10), (12, 26, 9)])
+    assert batch.shape == (2, len(close))
+    assert numpy.array_equal(batch[0], result, equal_nan=True)
+    assert numpy.array_equal(batch[1], stc(testdata_1m_btc, 12, 26, 9), equal_nan=True)
+
+    # Empty stochastic windows are NaN, like pandas
+    assert stc(testdata_1m_btc, length=0).isna().all()
+    empty = stc_batch(testdata_1m_btc, [(23, 50, 0), (23, 50, 10)])
+    assert numpy.isnan(empty[0]).all()
+    assert numpy.array_equal(empty[1], result, equal_nan=True)
+    with pytest.raises(ValueError, match=r"1 or greater"):
+        stc(testdata_1m_btc, fast=0)
+    with pytest.raises(ValueError, match=r"0 or greater"):
+        stc_batch(testdata_1m_btc, [(23, 50, -1)])
+
+
+def test_tke(testdata_1m_btc):
+    import talib.abstract as ta
+
+    from technical.indicators import TKE
+
+    df = testdata_1m_btc
+    columns = list(df.columns)
+    tke, tke_ema = TKE(df, length=14, emaperiod=5)
+
+    assert list(df.columns) == columns
+    assert tke.index.equals(df.index)
+    lowest_low = df["low"].rolling(14).min()
+    stoch = 100 * (df["close"] - lowest_low) / (df["high"].rolling(14).max() - lowest_low)
+    components = [
+        ta.RSI(df, timeperiod=14),
+        stoch,
+        ta.ULTOSC(df, timeperiod1=7, timeperiod2=14, timeperiod3=28),
+        ta.MFI(df, timeperiod=14),
+        ta.WILLR(df, timeperiod=14),
+        ta.ROCR100(df, timeperiod=14),
+        ta.CCI(df, timeperiod=14),
+    ]
+    expected = DataFrame(dict(enumerate(components))).mean(axis="columns")
+    assert numpy.allclose(tke, expected, equal_nan=True, rtol=1e-12)
+    assert numpy.allclose(tke_ema, ta.EMA(expected, timeperiod=5), equal_nan=True, rtol=1e-12)
+
+
+def test_pmax_grid(testdata_1m_btc):
+    from technical.indicators import PMAX, pmax_grid
+
+    pm, direction = pmax_grid(testdata_1m_btc, period=10, multiplier=[2, 3], length=[12, 20])
+
+    assert pm.shape == (2, 2, len(testdata_1m_btc))
+    assert direction.shape == pm.shape
+    assert direction.dtype == numpy.int8
+
+    for i, length in enumerate([12, 20]):
+        for j, multiplier in enumerate([2, 3]):
+            single = PMAX(testdata_1m_btc, period=10, multiplier=multiplier, length=length)
+            name = f"10_{multiplier}_{length}_1"
+            assert numpy.array_equal(pm[i, j], single[f"pm_{name}"].to_numpy())
+            labels = numpy.where(
+                direction[i, j] == 1, "up", numpy.where(direction[i, j] == -1, "down", "nan")
+            )
+            assert (labels == single[f"pmX_{name}"].to_numpy()).all()
+
+    # src is only used by the moving averages that take a source
+    wma = pmax_grid(testdata_1m_btc, length=[12], MAtype=7, src=4)[0]
+    assert numpy.array_equal(wma, pmax_grid(testdata_1m_btc, length=[12], MAtype=7)[0])
+    with pytest.raises(ValueError, match=r"src 4 not supported"):
+        pmax_grid(testdata_1m_btc, length=[12], MAtype=1, src=4)
+
+
+def test_supertrend_grid(testdata_1m_btc):
+    from technical.indicators import supertrend, supertrend_grid
+
+    st, direction = supertrend_grid(testdata_1m_btc, period=[7, 10], multiplier=[2, 3])
+
+    assert st.shape == (2, 2, len(testdata_1m_btc))
+    assert direction.shape == st.shape
+    assert direction.dtype == numpy.int8
+
+    for i, period in enumerate([7, 10]):
+        for j, multiplier in enumerate([2, 3]):
+            single_st, single_stx = supertrend(testdata_1m_btc, period, multiplier)
+            assert numpy.array_equal(st[i, j], single_st)
+            assert ((direction[i, j] == 1) == (single_stx == "up")).all()
+            assert ((direction[i, j] == -1) == (single_stx == "down")).all()
+
+
+def test_tv_trama(testdata_1m_btc):
+    from technical.indicators import tv_trama
+
+    result = tv_trama(testdata_1m_btc)
+
+    assert result.index.equals(testdata_1m_btc.index)
+    assert result.iloc[0] == testdata_1m_btc["close"].iloc[0]
+    assert result.notna().all()
+
+    batch = tv_trama(testdata_1m_btc, length=[20, 99])
+    assert batch.shape == (2, len(testdata_1m_btc))
+    assert numpy.array_equal(batch[0], tv_trama(testdata_1m_btc, 20).to_numpy())
+    assert numpy.array_equal(batch[1], result.to_numpy())
+
+    panel = tv_trama(testdata_1m_btc, length=[20, 99], field=["close", "open"])
+    assert panel.shape == (2, 2, len(testdata_1m_btc))
+    assert numpy.array_equal(panel[:, 0], batch)
+    assert numpy.array_equal(panel[0, 1], tv_trama(testdata_1m_btc, 20, "open").to_numpy())
@@ -0,0 +1,185 @@
+# pragma pylint: disable=missing-docstring
+
+import numpy as np
+import pytest
+import talib
+
+from technical import kernels
+from technical.kernels import (
+    _iir_loop,
+    _ma_bank,
+    iir_filter,
+    rolling_max,
+    rolling_min,
+    rolling_moments,
+    wilder_smooth,
+    wma,
+)
+
+
+@pytest.mark.parametrize(
+    "b,a,warmup",
+    [
+        ([0.5], [1, -0.5], 0),
+        ([0.2, 0.2], [1, -0.9, 0.3], 2),
+        ([1, -1], [2, -1], 1),
+    ],
+)
+def test_iir_filter(b, a, warmup):
+    x = np.random.default_rng(42).normal(size=(3, 200))
+
+    result = iir_filter(b, a, x, warmup)
+
+    assert result.shape == x.shape
+    assert np.array_equal(result[:, :warmup], x[:, :warmup])
+    # scipy backed result matches the plain recursion
+    expected = _iir_loop(np.array(b, dtype=float), np.array(a, dtype=float), x, warmup)
+    assert np.allclose(result, expected)
+    # 1D input filters the same as a row of the 2D input
+    assert np.allclose(iir_filter(b, a, x[1], warmup), result[1])
+
+
+def test_wilder_smooth():
+    x = np.array([np.nan, 6, -1, 5, 4, 12, 5, 11, 10, 3, 13], dtype=float)
+
+    # Leading NaNs are skipped, seeded with the SMA of the first 5 values
+    expected = [np.nan] * 5 + [5.2, 5.16, 6.328, 7.0624, 6.249920, 7.599936]
+    assert np.allclose(wilder_smooth(x, 5), expected, equal_nan=True)
+
+    # One row per period
+    batch = wilder_smooth(x, [3, 5])
+    assert batch.shape == (2, len(x))
+    assert np.allclose(batch[1], expected, equal_nan=True)
+    assert np.isnan(batch[0, :3]).all()
+    assert batch[0, 3] == 10 / 3
+
+    # 2D input, one series per row
+    rows = wilder_smooth(np.array([x, x * 2]), 5)
+    assert np.allclose(rows[1], np.array(expected) * 2, equal_nan=True)
+
+    # Too short to seed
+    assert np.isnan(wilder_smooth(x[:5], 5)).all()
+
+
+def test_wilder_smooth_nan_in_seed():
+    x = np.array([1, 2, np.nan, 4, 5, 6, 7, np.nan, 9], dtype=float)
+
+    # The NaN restarts the seed window - seeded with the SMA of 4, 5, 6
+    result = wilder_smooth(x, 3)
+    assert np.isnan(result[:5]).all()
+    assert result[5] == 5.0
+    assert result[6] == 17 / 3
+    # NaNs after the seed keep the previous value
+    assert result[7] == result[6]
+    assert result[8] == (result[7] * 2 + 9) / 3
+
+    # Never 3 consecutive values
+    assert np.isnan(wilder_smooth(np.array([1, 2, np.nan, 4, 5, np.nan]), 3)).all()
+
+
+def test_wma(testdata_1m_btc):
+    close = testdata_1m_btc["close"].to_numpy()
+    result = wma(np.array([close, close]), np.array([30, 7]), np.array([0.0, 0.0]))
+
+    # Running sums stay in line with the direct computation over long series
+    assert np.allclose(result[0], talib.WMA(close, 30), equal_nan=True, rtol=1e-12)
+    assert np.allclose(result[1], talib.WMA(close, 7), equal_nan=True, rtol=1e-12)
+
+    # NaN poisons the windows containing it only
+    values = np.arange(10, dtype=float)
+    values[4] = np.nan
+    result = wma(values.reshape(1, -1), np.array([3]), np.array([1.0]))[0]
+    assert np.isnan(result[:2]).all()
+    assert np.isnan(result[4:7]).all()
+    assert result[2] == (4 * 2 + 3 * 1 + 2 * 0) / 9
+    # Weights 4, 3, 2
+    assert result[7] == (4 * 7 + 3 * 6 + 2 * 5) / 9
+    assert result[9] == (4 * 9 + 3 * 8 + 2 * 7) / 9
+
+
+def test_rolling_moments(testdata_1m_btc, monkeypatch):
+    # The kernel itself - also when it is not compiled
+    monkeypatch.setattr(kernels, "JIT_ENABLED", True)
+
+    close = testdata_1m_btc["close"].copy()
+    close.iloc[300:305] = np.nan
+    # A flat stretch
+    close.iloc[1000:1100] = close.iloc[1000]
+
+    mean, std = rolling_moments(close, 20)
+    rolling = close.rolling(20)
+    assert np.allclose(mean, rolling.mean(), equal_nan=True, rtol=1e-12)
+    # pandas leaves rounding noise in flat windows
+    expected = rolling.std().to_numpy(copy=True)
+    expected[1019:1100] = 0
+    assert np.allclose(std, expected, equal_nan=True, rtol=1e-9)
+    assert np.isnan(mean[300:324]).all()
+    assert (std[1019:1100] == 0).all()
+    assert (mean[1019:1100] == close.iloc[1000]).all()
+
+    # One row per window, or per series
+    means, stds = rolling_moments(close, [20, 50], ddof=0)
+    assert means.shape == stds.shape == (2, len(close))
+    assert np.array_equal(means[0], mean, equal_nan=True)
+    assert np.allclose(stds[1], close.rolling(50).std(ddof=0), equal_nan=True, rtol=1e-9)
+    means, _ = rolling_moments(np.array([close, close * 2]), 20)
+    assert np.allclose(means[1], mean * 2, equal_nan=True)
+
+
+@pytest.mark.parametrize("jit", [True, False])
+def test_rolling_extrema(testdata_1m_btc, monkeypatch, jit):
+    # Without numba, pandas' rolling windows are used
+    monkeypatch.setattr(kernels, "JIT_ENABLED", jit)
+
+    close = testdata_1m_btc["close"].copy()
+    close.iloc[300:305] = np.nan
+
+    highs = rolling_max(close, [1, 9, 52])
+    lows = rolling_min(close, [1, 9, 52])
+    assert highs.shape == lows.shape == (3, len(close))
+    for row, window in enumerate([1, 9, 52]):
+        assert np.array_equal(highs[row], close.rolling(window).max(), equal_nan=True)
+        assert np.array_equal(lows[row], close.rolling(window).min(), equal_nan=True)
+    assert np.array_equal(rolling_max(close, 9), highs[1], equal_nan=True)
+
+    # One block per series
+    both = rolling_min(np.array([close, -close]), [9, 52])
+    assert both.shape == (2, 2, len(close))
+    assert np.array_equal(both[1, 0], -highs[1], equal_nan=True)
+
+    # Empty windows are NaN, like pandas
+    assert np.isnan(rolling_max(close, 0)).all()
+    assert np.isnan(rolling_min(close, [0, 9])[0]).all()
+    with pytest.raises(ValueError, match=r"0 or greater"):
+        rolling_max(close, -1)
+
+
+def test_ma_bank(testdata_1m_btc):
+    close = testdata_1m_btc["close"].to_numpy(copy=True)
+    close[:3] = np.nan
+    periods = [5, 10, 200]
+
+    sma = _ma_bank(close, periods, kind="sma")
+    ema = _ma_bank(close, periods, kind="ema")
+    wma = _ma_bank(close, periods, kind="wma")
+    assert sma.shape == ema.shape == wma.shape == (3, len(close))
+    for row, period in enumerate(periods):
+        assert np.array_equal(sma[row], talib.SMA(close, period), equal_nan=True)
+        assert np.array_equal(ema[row], talib.EMA(close, period), equal_nan=True)
+        assert np.allclose(wma[row], talib.WMA(close, period), equal_nan=True, rtol=1e-10)
+    assert np.array_equal(
+        _ma_bank(close, [14], kind="rma")[0], wilder_smooth(close, 14), equal_nan=True
+    )
+
+    # After a NaN, wma restarts where TA-Lib stays NaN
+    gap = close.copy()
+    gap[1000] = np.nan
+    restarted = _ma_bank(gap, [5], kind="wma")[0]
+    assert np.isnan(restarted[1000:1005]).all()
+    assert np.allclose(restarted[1005:], talib.WMA(close[1001:], 5)[4:], rtol=1e-10)
+    assert np.isnan(talib.WMA(gap, 5)[1005:]).all()
+
+    with pytest.raises(ValueError):
+        _ma_bank(close, periods, kind="tema")
+    with pytest.raises(ValueError, match=r"1 or greater"):
+        _ma_bank(close, [0, 10], kind="ema")
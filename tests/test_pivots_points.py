@@ -0,0 +1,80 @@
+# pragma pylint: disable=missing-docstring
+
+import numpy as np
+import pytest
+
+from technical import qtpylib
+from technical.pivots_points import pivot_levels, pivots, pivots_points
+
+
+def test_pivot_levels():
+    # High 10, low 8, close 9
+    high, low, close = [10.0], [8.0], [9.0]
+
+    standard = pivot_levels(high, low, close, 3)
+    assert standard[:, 0].tolist() == [9, 10, 8, 11, 7, 13, 5]
+    woodie = pivot_levels(high, low, close, 4, method="woodie")
+    assert woodie[:, 0].tolist() == [9, 10, 8, 11, 7, 12, 6, 14, 4]
+    fibonacci = pivot_levels(high, low, close, 4, method="fibonacci")
+    assert np.allclose(fibonacci[1::2, 0], 9 + np.array([0.382, 0.618, 1.0, 1.618]) * 2)
+    assert np.allclose(fibonacci[2::2, 0], 9 - np.array([0.382, 0.618, 1.0, 1.618]) * 2)
+    camarilla = pivot_levels(high, low, [9.5], 4, method="camarilla")
+    assert np.allclose(camarilla[1::2, 0], 9.5 + 2.2 / np.array([12, 6, 4, 2]))
+
+    with pytest.raises(ValueError, match=r"up to 4 levels"):
+        pivot_levels(high, low, close, 5, method="camarilla")
+    with pytest.raises(ValueError, match=r"not supported"):
+        pivot_levels(high, low, close, method="demark")
+    with pytest.raises(ValueError, match=r"0 or greater"):
+        pivot_levels(high, low, close, -1)
+
+    # No levels - the pivot only
+    for method in ("standard", "fibonacci", "camarilla", "woodie"):
+        assert pivot_levels(high, low, close, 0, method=method)[:, 0].tolist() == [9]
+
+    # A precomputed pivot replaces the close, except for camarilla
+    assert np.array_equal(pivot_levels(high, low, None, 3, pivot=[9.0]), standard)
+    with pytest.raises(ValueError, match=r"close is required"):
+        pivot_levels(high, low, None, 2, method="camarilla", pivot=[9.0])
+
+
+def test_pivots_points(testdata_1m_btc):
+    result = pivots_points(testdata_1m_btc, timeperiod=30, levels=3)
+
+    assert list(result.columns) == ["pivot", "r1", "s1", "r2", "s2", "r3", "s3"]
+    assert result.index.equals(testdata_1m_btc.index)
+    pivot = qtpylib.rolling_mean(qtpylib.typical_price(testdata_1m_btc), window=30)
+    low = qtpylib.rolling_mean(testdata_1m_btc["low"], window=30)
+    high = qtpylib.rolling_mean(testdata_1m_btc["high"], window=30)
+    assert np.array_equal(result["pivot"], pivot, equal_nan=True)
+    assert np.array_equal(result["r1"], 2 * pivot - low, equal_nan=True)
+    assert np.array_equal(result["s1"], 2 * pivot - high, equal_nan=True)
+    r2 = (pivot - result["s1"]) + result["r1"]
+    s2 = pivot - (result["r1"] - result["s1"])
+    assert np.allclose(result["r2"], r2, equal_nan=True, rtol=1e-14)
+    assert np.allclose(result["s3"], pivot - (r2 - s2), equal_nan=True, rtol=1e-14)
+
+    pivot_only = pivots_points(testdata_1m_btc, timeperiod=30, levels=0)
+    assert list(pivot_only.columns) == ["pivot"]
+    assert np.array_equal(pivot_only["pivot"], result["pivot"], equal_nan=True)
+
+
+def test_pivots(testdata_1m_btc):
+    df = testdata_1m_btc
+
+    rolling = pivots(df, timeperiod=60, levels=2, method="fibonacci")
+    assert rolling.shape == (5, len(df))
+    expected = pivot_levels(
+        df["high"].rolling(60).max(), df["low"].rolling(60).min(), df["close"], 2, "fibonacci"
+    )
+    assert np.array_equal(rolling, expected, equal_nan=True)
+
+    # Levels of each candle come from the previous hour
+    hourly = pivots(df, levels=2, method="camarilla", period="1h")
+    hours = df["date"].dt.floor("1h")
+    candles = df.groupby(hours).agg({"high": "max", "low": "min", "close": "last"}).shift(1)
+    previous = candles.loc[hours]
+    expected = pivot_levels(previous["high"], previous["low"], previous["close"], 2, "camarilla")
+    assert np.array_equal(hourly, expected, equal_nan=True)
+    assert np.isnan(hourly[:, hours == hours.iloc[0]]).all()
+    assert not np.isnan(hourly[:, hours != hours.iloc[0]]).any()
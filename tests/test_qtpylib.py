@@ -0,0 +1,100 @@
+# pragma pylint: disable=missing-docstring
+
+import numpy as np
+import pytest
+import talib
+
+from technical import kernels, qtpylib
+
+
+def test_rsi(testdata_1m_btc):
+    result = qtpylib.rsi(testdata_1m_btc["close"], 14)
+
+    assert result.index.equals(testdata_1m_btc.index)
+    # Wilder smoothing seeded with the SMA of the first 14 deltas, like TA-Lib
+    expected = talib.RSI(testdata_1m_btc["close"].to_numpy(), 14)
+    assert np.allclose(result, expected, equal_nan=True)
+
+
+def test_atr_exp(testdata_1m_btc):
+    from technical.indicators import rma
+
+    result = qtpylib.atr(testdata_1m_btc, 14, exp=True)
+
+    tr = qtpylib.true_range(testdata_1m_btc).to_frame("tr")
+    assert result.index.equals(testdata_1m_btc.index)
+    assert np.allclose(result, rma(tr, 14, field="tr"), equal_nan=True)
+    assert result.isna().sum() == 13
+
+
+@pytest.mark.parametrize("jit", [True, False])
+def test_rolling_mean_std(testdata_1m_btc, monkeypatch, jit):
+    # Without numba, pandas' rolling windows are used
+    monkeypatch.setattr(kernels, "JIT_ENABLED", jit)
+    close = testdata_1m_btc["close"]
+
+    mean = qtpylib.rolling_mean(close, 200)
+    std = qtpylib.rolling_std(close, 200)
+    assert mean.index.equals(close.index)
+    assert np.allclose(mean, close.rolling(200).mean(), equal_nan=True, rtol=1e-12)
+    assert np.allclose(std, close.rolling(200).std(), equal_nan=True, rtol=1e-9)
+    assert mean.iloc[:199].isna().all()
+
+    zscore = qtpylib.zscore(testdata_1m_btc, 20)
+    expected = (close - close.rolling(20).mean()) / close.rolling(20).std()
+    finite = np.isfinite(expected)
+    assert np.allclose(zscore[finite], expected[finite], rtol=1e-6)
+
+
+@pytest.mark.parametrize("jit", [True, False])
+def test_rolling_min_max(testdata_1m_btc, monkeypatch, jit):
+    monkeypatch.setattr(kernels, "JIT_ENABLED", jit)
+    low = testdata_1m_btc["low"]
+
+    assert qtpylib.rolling_min(low, 14).equals(low.rolling(14).min())
+    assert qtpylib.rolling_max(low, 14).equals(low.rolling(14).max())
+    assert qtpylib.rolling_max(low, 14, min_periods=1).equals(low.rolling(14, 1).max())
+
+
+def test_chopiness(testdata_1m_btc):
+    from technical.indicators import chopiness
+
+    result = qtpylib.chopiness(testdata_1m_btc, 14)
+
+    atrsum = qtpylib.true_range(testdata_1m_btc).rolling(14).sum()
+    high_low = testdata_1m_btc["high"].rolling(14).max() - testdata_1m_btc["low"].rolling(14).min()
+    assert result.index.equals(testdata_1m_btc.index)
+    assert np.allclose(result, 100 * np.log10(atrsum / high_low) / np.log10(14), equal_nan=True)
+    assert result.iloc[:13].isna().all()
+
+    # indicators.chopiness leaves out the first candle, which has no previous close
+    ci = chopiness(testdata_1m_btc, 14)
+    assert ci.iloc[:14].isna().all()
+    assert np.allclose(ci.iloc[14:], result.iloc[14:])
+
+    batch = qtpylib.chopiness(testdata_1m_btc, [14, 30])
+    assert batch.shape == (2, len(testdata_1m_btc))
+    assert np.array_equal(batch[0], result, equal_nan=True)
+    assert np.array_equal(chopiness(testdata_1m_btc, [14])[0], ci, equal_nan=True)
+
+    gaps = testdata_1m_btc.copy()
+    gaps.loc[gaps.index[1000], "high"] = np.nan
+    gaps.loc[gaps.index[2000], "close"] = np.nan
+    ci_gaps = chopiness(gaps, 14)
+    # Windows containing the missing high are NaN
+    assert ci_gaps.iloc[1000:1014].isna().all()
+    assert np.allclose(ci_gaps.iloc[1014:1999], ci.iloc[1014:1999])
+    # The candle after the missing close uses its high - low range as true range
+    tr = qtpylib.true_range(gaps)
+    tr.iloc[2001] = gaps["high"].iloc[2001] - gaps["low"].iloc[2001]
+    high_low = gaps["high"].rolling(14).max() - gaps["low"].rolling(14).min()
+    expected = 100 * np.log10(tr.rolling(14).sum() / high_low) / np.log10(14)
+    assert ci_gaps.iloc[1999:].notna().all()
+    assert np.allclose(ci_gaps.iloc[1999:], expected.iloc[1999:])
+
+    # Empty windows are NaN, like pandas
+    assert qtpylib.chopiness(testdata_1m_btc, 0).isna().all()
+    assert chopiness(testdata_1m_btc, 0).isna().all()
+    assert np.array_equal(qtpylib.chopiness(testdata_1m_btc, [0, 14])[1], result, equal_nan=True)
+    with pytest.raises(ValueError, match=r"0 or greater"):
+        chopiness(testdata_1m_btc, -1)
@@ -0,0 +1,47 @@
+# pragma pylint: disable=missing-docstring
+
+import numpy as np
+import pytest
+from pandas import DataFrame
+
+from technical.trendline import rolling_trendlines
+
+
+def test_rolling_trendlines():
+    close = [1.0, 3.0, 2.0, 2.0, 5.0, 4.0, 3.0, 6.0]
+    result = rolling_trendlines(DataFrame({"close": close}), window=4)
+
+    assert list(result.columns) == ["Data", "Max Line", "Min Line"]
+    assert result["Max Line"].iloc[:3].isna().all()
+    # Candles 0-1 and 2-3: highs 3.0 @ 1 and 2.0 @ 3 (most recent tie)
+    assert result["Max Line"].iloc[3] == 2.0
+    # highs 3.0 @ 1 and 5.0 @ 4
+    assert result["Max Line"].iloc[4] == 5.0
+    # highs 2.0 @ 3 and 5.0 @ 4, extended by one candle
+    assert result["Max Line"].iloc[5] == 8.0
+    # Candles 4-5 and 6-7: highs 5.0 @ 4 and 6.0 @ 7
+    assert result["Max Line"].iloc[7] == 6.0
+    assert np.isclose(result["Min Line"].iloc[7], 3.0 + (3.0 - 4.0) / (6 - 5))
+
+
+def test_rolling_trendlines_causal(testdata_1m_btc):
+    full = rolling_trendlines(testdata_1m_btc, window=60)
+    partial = rolling_trendlines(testdata_1m_btc.iloc[:1000], window=60)
+
+    assert full.index.equals(testdata_1m_btc.index)
+    assert full["Max Line"].iloc[:59].isna().all()
+    assert full["Max Line"].iloc[59:].notna().all()
+    # Future candles don't change past values
+    assert full.iloc[:1000].equals(partial)
+
+    lines = rolling_trendlines(testdata_1m_btc, ["close", "high"], window=60)
+    assert lines.shape == (2, 2, len(testdata_1m_btc))
+    assert np.array_equal(lines[0, 0], full["Max Line"], equal_nan=True)
+    high = rolling_trendlines(testdata_1m_btc, "high", 60)
+    assert np.array_equal(lines[1, 1], high["Min Line"], equal_nan=True)
+
+
+@pytest.mark.parametrize("window", [0, 1])
+def test_rolling_trendlines_window(window):
+    with pytest.raises(ValueError, match=r"window must be at least 2"):
+        rolling_trendlines(DataFrame({"close": [1.0, 2.0, 3.0]}), window=window)